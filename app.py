@@ -23,6 +23,8 @@ from cardiac_report.calculations import (
     vo2_percentile_and_label,
     get_vo2_reference_values,
     mitral_regurgitation_severity,
+    LVMetrics,
+    classify_lv,
 )
 from cardiac_report.formatting import color_status_html
 from cardiac_report.reports import (
@@ -61,7 +63,7 @@ from cardiac_report.holter import (
 from cardiac_report.pdf_ingest.fietstest_pdf import parse_fietstest_pdf
 from cardiac_report.pdf_ingest.ecg_pdf import parse_ecg_pdf
 from cardiac_report.pdf_ingest.utils import PDF_DEPENDENCY_MESSAGE, pdf_dependency_available
-from cardiac_report.beleid import CLINICAL_SCENARIOS
+from cardiac_report.beleid import CLINICAL_SCENARIOS, SCENARIO_TREE, find as find_scenarios, search as search_scenarios
 
 
 def safe_rerun() -> None:
@@ -210,12 +212,13 @@ def _post_snapshot_to_backend(study_type: str, snapshot: StudySnapshot) -> Optio
     if not BACKEND_ENABLED:
         return None
     url = f"{API_BASE}/api/studies/{study_type}/from-snapshot"
+    payload = snapshot.to_dict()
     body = {
-        "patient": snapshot.to_dict().get("patient", {}),
+        "patient": payload.get("patient", {}),
         "study_type": study_type,
         "study_datetime": None,
         "source": "manual",
-        "payload": snapshot.to_dict(),
+        "payload": payload,
     }
     try:
         resp = requests.post(url, json=body, headers=_authorized_headers(), timeout=20)
@@ -629,8 +632,21 @@ if module == "Beleid":
 
     # Scenario's worden geladen uit cardiac_report/beleid.py
 
-    # Scenario selectie
-    scenario_names = list(CLINICAL_SCENARIOS.keys())
+    # Scenario selectie, optioneel beperkt tot één categorie
+    all_categories = "Alle categorieën"
+    selected_category = st.selectbox(
+        "Categorie",
+        options=[all_categories] + list(SCENARIO_TREE.children),
+        key="beleid_category",
+    )
+    scenario_names = find_scenarios(category=None if selected_category == all_categories else selected_category)
+    search_query = st.text_input("Zoek in plannen (trefwoorden)", key="beleid_search")
+    if search_query.strip():
+        matches = set(search_scenarios(search_query))
+        scenario_names = [name for name in scenario_names if name in matches]
+        if not scenario_names:
+            st.warning("Geen scenario's gevonden voor deze zoekterm.")
+            st.stop()
     selected_scenario = st.selectbox(
         "Selecteer klinisch scenario",
         options=scenario_names,
@@ -640,13 +656,12 @@ if module == "Beleid":
     )
 
     scenario_data = CLINICAL_SCENARIOS[selected_scenario]
-    st.info(f"**Beschrijving**: {scenario_data['description']}")
+    st.info(f"**Beschrijving**: {scenario_data.description}")
 
     st.subheader(f"Aanbevolen beleid: {selected_scenario}")
 
     # Genereer plan tekst
-    plan_lines = scenario_data["plan"]
-    plan_text = "\n".join(plan_lines)
+    plan_text = scenario_data.plan
 
     # Toon plan in expandable sectie
     with st.expander("📋 Volledig klinisch plan", expanded=True):
@@ -2656,10 +2671,13 @@ if module == "Echo":
     with col1:
         # Automatic LV geometry calculations (use values above) — only if measurements present
         if ivsd is not None and lvidd is not None and lvpw is not None:
-            lv_mass_g = compute_lv_mass_g(ivsd, lvidd, lvpw)
-            rwt = compute_rwt(lvpw, lvidd)
-            mass_index, mass_severity = lv_mass_index_severity(lv_mass_g, bsa, sex)
-            lv_hypertrofie_auto = determine_lv_geometry(mass_index, mass_severity, rwt)
+            lv = classify_lv(LVMetrics(ivsd_mm=ivsd, lvidd_mm=lvidd, lvpwd_mm=lvpw, bsa_m2=bsa, sex=sex))
+            lv_mass_g = lv.lv_mass_g
+            rwt = lv.rwt
+            mass_index = lv.mass_index
+            mass_severity = lv.mass_severity
+            lv_hypertrofie_auto = lv.geometry
+            lv_dilatatie_auto = lv.dilatation
         else:
             lv_mass_g = None
             rwt = None
@@ -2667,12 +2685,11 @@ if module == "Echo":
             mass_severity = None
             # default to normal when measurements not provided
             lv_hypertrofie_auto = "Normotroof"
-
-        if lvidd is not None:
-            lv_dilatatie_auto = classify_lvidd(lvidd, sex, bsa)
-        else:
-            # default to not dilated when LVIDd missing
-            lv_dilatatie_auto = "niet gedilateerd"
+            if lvidd is not None:
+                lv_dilatatie_auto = classify_lvidd(lvidd, sex, bsa)
+            else:
+                # default to not dilated when LVIDd missing
+                lv_dilatatie_auto = "niet gedilateerd"
 
         # Allow manual overrides while showing automatic suggestions
         lv_hypertrofie_choice = st.selectbox(
@@ -2,85 +2,131 @@
 from __future__ import annotations
 
 import math
-from typing import Optional, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 
 # VO2 percentile reference values (FRIEND registry) for cycle ergometer
-# Stored as: ref_values[sex]['age_bucket'] = {'p95':..., 'p75':..., 'p50':..., 'p25':..., 'p5':...}
-_REF_VALUES = {
-    'Man': {
-        20: {'p95':54.0,'p75':48.0,'p50':43.0,'p25':38.0,'p5':33.0},
-        30: {'p95':50.0,'p75':44.0,'p50':40.0,'p25':35.0,'p5':30.0},
-        40: {'p95':47.0,'p75':41.0,'p50':36.0,'p25':32.0,'p5':28.0},
-        50: {'p95':43.0,'p75':38.0,'p50':33.0,'p25':29.0,'p5':25.0},
-        60: {'p95':38.0,'p75':34.0,'p50':30.0,'p25':26.0,'p5':22.0},
-        70: {'p95':34.0,'p75':30.0,'p50':26.0,'p25':23.0,'p5':20.0},
-    },
-    'Vrouw': {
-        20: {'p95':43.0,'p75':38.0,'p50':34.0,'p25':30.0,'p5':26.0},
-        30: {'p95':40.0,'p75':36.0,'p50':32.0,'p25':28.0,'p5':24.0},
-        40: {'p95':36.0,'p75':32.0,'p50':29.0,'p25':26.0,'p5':22.0},
-        50: {'p95':33.0,'p75':30.0,'p50':27.0,'p25':24.0,'p5':20.0},
-        60: {'p95':30.0,'p75':27.0,'p50':24.0,'p25':21.0,'p5':18.0},
-        70: {'p95':27.0,'p75':25.0,'p50':22.0,'p25':19.0,'p5':17.0},
-    }
+# Stored as: _REF_VALUES[sex][age_bucket] = (p95, p75, p50, p25, p5)
+_REF_PERCENTILES = ('p95', 'p75', 'p50', 'p25', 'p5')
+_REF_VALUES: Mapping[str, Mapping[int, Tuple[float, ...]]] = MappingProxyType({
+    'Man': MappingProxyType({
+        20: (54.0, 48.0, 43.0, 38.0, 33.0),
+        30: (50.0, 44.0, 40.0, 35.0, 30.0),
+        40: (47.0, 41.0, 36.0, 32.0, 28.0),
+        50: (43.0, 38.0, 33.0, 29.0, 25.0),
+        60: (38.0, 34.0, 30.0, 26.0, 22.0),
+        70: (34.0, 30.0, 26.0, 23.0, 20.0),
+    }),
+    'Vrouw': MappingProxyType({
+        20: (43.0, 38.0, 34.0, 30.0, 26.0),
+        30: (40.0, 36.0, 32.0, 28.0, 24.0),
+        40: (36.0, 32.0, 29.0, 26.0, 22.0),
+        50: (33.0, 30.0, 27.0, 24.0, 20.0),
+        60: (30.0, 27.0, 24.0, 21.0, 18.0),
+        70: (27.0, 25.0, 22.0, 19.0, 17.0),
+    }),
+})
+
+# Percentile bands for vo2_percentile_and_label, lowest first.
+_VO2_BANDS = (
+    ("<5%", "Slechte inspanningscapaciteit"),
+    ("5-25%", "Ondergemiddelde inspanningscapaciteit"),
+    ("25-75%", "Normale inspanningscapaciteit"),
+    ("75-95%", "Bovengemiddelde inspanningscapaciteit"),
+    (">=95%", "Uitstekende inspanningscapaciteit"),
+)
+# (percent of p50, band, band text) as returned by vo2_percentile_and_label.
+Vo2Percentile = Tuple[Optional[float], Optional[str], Optional[str]]
+
+
+def _above(limit: float) -> float:
+    """Smallest float above `limit`: turns an inclusive upper limit into a lower bound."""
+    return math.nextafter(limit, math.inf)
+
+
+def _sex_key(sex: str) -> str:
+    return "Man" if sex == "Man" else "Vrouw"
+
+
+def _band(value: float, lower_bounds: Tuple[float, ...], labels: Tuple[str, ...]) -> str:
+    """Return the label of the band containing `value`; `lower_bounds[i]` starts band i + 1."""
+    return labels[bisect_right(lower_bounds, value)]
+
+
+# Classification tables: ascending lower bounds per band, then the band labels.
+_SEVERITY_LABELS = ("Normaal", "Mild", "Matig", "Ernstig")
+# LV geometry by relative wall thickness: <0.32, 0.32-0.42, >0.42.
+_RWT_BOUNDS = (0.32, _above(0.42))
+_HYPERTROPHY_PATTERNS = ("eccentrisch", "gemengd", "concentrisch")
+_REMODELING_PATTERNS = ("Eccentrische remodeling", "Normotroof", "Concentrische remodeling")
+_IVSD_BOUNDS: Dict[str, Tuple[float, ...]] = {
+    "Man": (_above(10), _above(13), _above(16)),
+    "Vrouw": (_above(9), _above(12), _above(15)),
+}
+_IVSD_LABELS = (
+    "Normotroof",
+    "Mild concentrisch hypertroof",
+    "Matig concentrisch hypertroof",
+    "Ernstig concentrisch hypertroof",
+)
+_LAVI_BOUNDS = (_above(34), _above(41), _above(48))
+_LAVI_LABELS = ("Niet gedilateerd", "Mild gedilateerd", "Matig gedilateerd", "Ernstig gedilateerd")
+# Values above the normal range (>72% man, >74% vrouw) are hyperdynamic, not reduced.
+_LVEF_BOUNDS: Dict[str, Tuple[float, ...]] = {
+    "Man": (30, 41, 52),
+    "Vrouw": (30, 41, 54),
+}
+_LVEF_LABELS = ("Ernstig", "Matig", "Mild", "Normaal")
+_LV_MASS_INDEX_BOUNDS: Dict[str, Tuple[float, ...]] = {
+    "Man": (_above(115), _above(131), _above(148)),
+    "Vrouw": (95, _above(108), _above(121)),
+}
+# LVIDd indexed to BSA (mm/m^2) and the absolute fallback (mm).
+_LVIDD_INDEX_BOUNDS: Dict[str, Tuple[float, ...]] = {
+    "Man": (31, _above(34), _above(36)),
+    "Vrouw": (32, _above(35), _above(37)),
 }
+_LVIDD_MM_BOUNDS: Dict[str, Tuple[float, ...]] = {
+    "Man": (_above(58), _above(63), _above(68)),
+    "Vrouw": (_above(52), _above(56), _above(61)),
+}
+_LVIDD_LABELS = ("niet gedilateerd", "mild gedilateerd", "matig gedilateerd", "ernstig gedilateerd")
+_TAPSE_BOUNDS = (11, 13, _above(17))
+_TAPSE_LABELS = (
+    "ernstig verminderde longitudinale systolische functie",
+    "matig verminderde longitudinale systolische functie",
+    "mild verminderde longitudinale systolische functie",
+    "goede longitudinale systolische functie",
+)
+# sqrt(3600) == 60, so Mosteller needs one multiply instead of a division.
+_INV_60 = 1.0 / 60.0
+# ASE-corrected Devereux formula: 0.8 * 1.04 * [(IVS + LVIDd + PW)^3 - LVIDd^3] + 0.6
+_DEVEREUX_FACTOR = 0.8 * 1.04
+# Grade 2/3 lower bounds for mitral_regurgitation_severity: EROA (cm^2), RVol (ml), RF (%).
+_MR_BOUNDS = ((0.2, 0.4), (30, 60), (30, _above(50)))
 
 
 def bsa_mosteller(length_cm: float, weight_kg: float) -> float:
-    """Mosteller formula for body surface area."""
-    return math.sqrt((length_cm * weight_kg) / 3600.0)
+    """Mosteller formula for body surface area: sqrt(length * weight / 3600)."""
+    return math.sqrt(length_cm * weight_kg) * _INV_60
 
 
 def classify_ivsd(ivsd_mm: float, sex: str) -> str:
-    if sex == "Man":
-        if ivsd_mm <= 10:
-            return "Normotroof"
-        if ivsd_mm <= 13:
-            return "Mild concentrisch hypertroof"
-        if ivsd_mm <= 16:
-            return "Matig concentrisch hypertroof"
-        return "Ernstig concentrisch hypertroof"
-    # Vrouw
-    if ivsd_mm <= 9:
-        return "Normotroof"
-    if ivsd_mm <= 12:
-        return "Mild concentrisch hypertroof"
-    if ivsd_mm <= 15:
-        return "Matig concentrisch hypertroof"
-    return "Ernstig concentrisch hypertroof"
+    return _band(ivsd_mm, _IVSD_BOUNDS[_sex_key(sex)], _IVSD_LABELS)
 
 
 def classify_lavi(lavi_ml_m2: float) -> str:
-    if lavi_ml_m2 <= 34:
-        return "Niet gedilateerd"
-    if lavi_ml_m2 <= 41:
-        return "Mild gedilateerd"
-    if lavi_ml_m2 <= 48:
-        return "Matig gedilateerd"
-    return "Ernstig gedilateerd"
+    return _band(lavi_ml_m2, _LAVI_BOUNDS, _LAVI_LABELS)
 
 
 def classify_lvef(lvef_pct: float, sex: str) -> str:
-    if lvef_pct < 30:
-        return "Ernstig"
-    if 30 <= lvef_pct <= 40:
-        return "Matig"
-    if sex == "Man":
-        if 41 <= lvef_pct <= 51:
-            return "Mild"
-    else:
-        if 41 <= lvef_pct <= 53:
-            return "Mild"
-    if sex == "Man":
-        if 52 <= lvef_pct <= 72:
-            return "Normaal"
-    else:
-        if 54 <= lvef_pct <= 74:
-            return "Normaal"
-    if lvef_pct < 41:
-        return "Matig"
-    return "Mild"
+    if math.isnan(lvef_pct):
+        return "Onbekend"
+    return _band(lvef_pct, _LVEF_BOUNDS[_sex_key(sex)], _LVEF_LABELS)
 
 
 def lvef_to_systolic_option(lvef_class: str) -> str:
@@ -97,49 +143,33 @@ def compute_lv_mass_g(ivsd_mm: float, lvidd_mm: float, lvpwd_mm: float) -> float
     ivs = ivsd_mm / 10.0
     lvidd = lvidd_mm / 10.0
     lvpw = lvpwd_mm / 10.0
-    lv_mass = 0.8 * (1.04 * ((ivs + lvidd + lvpw) ** 3 - (lvidd ** 3))) + 0.6
+    total = ivs + lvidd + lvpw
+    lv_mass = _DEVEREUX_FACTOR * (total * total * total - lvidd * lvidd * lvidd) + 0.6
     return round(lv_mass, 1)
 
 
 def compute_rwt(lvpwd_mm: float, lvidd_mm: float) -> float:
-    try:
-        return round((2.0 * lvpwd_mm) / lvidd_mm, 3)
-    except Exception:
+    if not lvidd_mm or lvpwd_mm is None:
         return 0.0
+    return round((2.0 * lvpwd_mm) / lvidd_mm, 3)
+
+
+def _mass_index_grade(lv_mass_g: float, bsa_m2: float, sex_key: str) -> Tuple[float, str]:
+    mass_index = round(lv_mass_g / max(0.1, bsa_m2), 1)
+    return mass_index, _band(mass_index, _LV_MASS_INDEX_BOUNDS[sex_key], _SEVERITY_LABELS)
 
 
 def lv_mass_index_severity(lv_mass_g: float, bsa_m2: float, sex: str) -> Tuple[float, str]:
-    mass_index = lv_mass_g / max(0.1, bsa_m2)
-    mass_index = round(mass_index, 1)
-    if sex == "Man":
-        if mass_index < 115:
-            return mass_index, "Normaal"
-        if 116 <= mass_index <= 131:
-            return mass_index, "Mild"
-        if 132 <= mass_index <= 148:
-            return mass_index, "Matig"
-        return mass_index, "Ernstig"
-    if mass_index < 95:
-        return mass_index, "Normaal"
-    if 95 <= mass_index <= 108:
-        return mass_index, "Mild"
-    if 109 <= mass_index <= 121:
-        return mass_index, "Matig"
-    return mass_index, "Ernstig"
+    return _mass_index_grade(lv_mass_g, bsa_m2, _sex_key(sex))
 
 
 def determine_lv_geometry(mass_index: float, severity_key: str, rwt: float) -> str:
-    if severity_key != "Normaal":
-        if rwt > 0.42:
-            return f"{severity_key} concentrisch hypertroof"
-        if rwt < 0.32:
-            return f"{severity_key} eccentrisch hypertroof"
-        return f"{severity_key} gemengd hypertroof"
-    if rwt > 0.42:
-        return "Concentrische remodeling"
-    if rwt < 0.32:
-        return "Eccentrische remodeling"
-    return "Normotroof"
+    if math.isnan(rwt):
+        return "Onbekend"
+    pattern = bisect_right(_RWT_BOUNDS, rwt)
+    if severity_key != _SEVERITY_LABELS[0]:
+        return f"{severity_key} {_HYPERTROPHY_PATTERNS[pattern]} hypertroof"
+    return _REMODELING_PATTERNS[pattern]
 
 
 def classify_lvidd(lvidd_mm: float, sex: str, bsa_m2: Optional[float] = None) -> str:
@@ -149,168 +179,125 @@ def classify_lvidd(lvidd_mm: float, sex: str, bsa_m2: Optional[float] = None) ->
     thresholds requested by the user. If BSA is not available, falls back to
     the previous absolute-mm thresholds.
     """
+    return _lvidd_grade(lvidd_mm, _sex_key(sex), bsa_m2)
+
+
+def _lvidd_grade(lvidd_mm: float, sex_key: str, bsa_m2: Optional[float]) -> str:
     # Use indexed thresholds when possible
     try:
         if bsa_m2 is not None and float(bsa_m2) > 0:
             lvidd_idx = round(float(lvidd_mm) / float(bsa_m2), 1)
         else:
             lvidd_idx = None
-    except Exception:
+    except (TypeError, ValueError):
         lvidd_idx = None
 
-    # Indexed thresholds (mm/m^2)
+    # Indexed thresholds (mm/m^2); fallback: absolute-mm thresholds when index not available
     if lvidd_idx is not None:
-        if sex == "Man":
-            if lvidd_idx < 31:
-                return "niet gedilateerd"
-            if 31 <= lvidd_idx <= 34:
-                return "mild gedilateerd"
-            if 34 < lvidd_idx <= 36:
-                return "matig gedilateerd"
-            return "ernstig gedilateerd"
-        # Vrouw
-        if lvidd_idx < 32:
-            return "niet gedilateerd"
-        if 32 <= lvidd_idx <= 35:
-            return "mild gedilateerd"
-        if 35 < lvidd_idx <= 37:
-            return "matig gedilateerd"
-        return "ernstig gedilateerd"
-
-    # Fallback: previous absolute-mm thresholds when index not available
-    if sex == "Man":
-        if lvidd_mm < 58:
-            return "niet gedilateerd"
-        if 59 <= lvidd_mm <= 63:
-            return "mild gedilateerd"
-        if 64 <= lvidd_mm <= 68:
-            return "matig gedilateerd"
-        return "ernstig gedilateerd"
-    if lvidd_mm < 52:
-        return "niet gedilateerd"
-    if 53 <= lvidd_mm <= 56:
-        return "mild gedilateerd"
-    if 57 <= lvidd_mm <= 61:
-        return "matig gedilateerd"
-    return "ernstig gedilateerd"
+        return _band(lvidd_idx, _LVIDD_INDEX_BOUNDS[sex_key], _LVIDD_LABELS)
+    return _band(lvidd_mm, _LVIDD_MM_BOUNDS[sex_key], _LVIDD_LABELS)
 
 
 def classify_tapse(tapse_mm: float) -> str:
     try:
         t = float(tapse_mm)
-    except Exception:
+    except (TypeError, ValueError):
         return "Onbekend"
-    if t > 17:
-        return "goede longitudinale systolische functie"
-    if 13 <= t <= 17:
-        return "mild verminderde longitudinale systolische functie"
-    if 11 <= t < 13:
-        return "matig verminderde longitudinale systolische functie"
-    return "ernstig verminderde longitudinale systolische functie"
-
-
-def vo2_percentile_and_label(sex: str, age: float, vo2_mlkg: float):
+    if math.isnan(t):
+        return "Onbekend"
+    return _band(t, _TAPSE_BOUNDS, _TAPSE_LABELS)
+
+
+@dataclass(frozen=True, slots=True)
+class LVMetrics:
+    """LV wall and cavity measurements (mm) plus the patient data needed to grade them."""
+
+    ivsd_mm: float
+    lvidd_mm: float
+    lvpwd_mm: float
+    bsa_m2: float
+    sex: str
+
+
+@dataclass(frozen=True, slots=True)
+class LVClassification:
+    """Derived LV values and labels produced by `classify_lv`."""
+
+    lv_mass_g: float
+    rwt: float
+    mass_index: float
+    mass_severity: str
+    geometry: str
+    dilatation: str
+
+
+def classify_lv(metrics: LVMetrics) -> LVClassification:
+    """Compute LV mass, RWT, mass index, geometry and LVIDd dilatation in one pass."""
+    sex_key = _sex_key(metrics.sex)
+    ivsd_mm = metrics.ivsd_mm
+    lvidd_mm = metrics.lvidd_mm
+    lvpwd_mm = metrics.lvpwd_mm
+    bsa_m2 = metrics.bsa_m2
+    lv_mass_g = compute_lv_mass_g(ivsd_mm, lvidd_mm, lvpwd_mm)
+    rwt = compute_rwt(lvpwd_mm, lvidd_mm)
+    mass_index, mass_severity = _mass_index_grade(lv_mass_g, bsa_m2, sex_key)
+    return LVClassification(
+        lv_mass_g=lv_mass_g,
+        rwt=rwt,
+        mass_index=mass_index,
+        mass_severity=mass_severity,
+        geometry=determine_lv_geometry(mass_index, mass_severity, rwt),
+        dilatation=_lvidd_grade(lvidd_mm, sex_key, bsa_m2),
+    )
+
+
+def _age_bucket(age: float) -> int:
+    """Return the `_REF_VALUES` age bucket (decade, clamped to 20-70); unknown age counts as 50."""
     try:
         a = int(age)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         a = 50
-    if a < 20:
-        bucket = 20
-    elif a < 30:
-        bucket = 20
-    elif a < 40:
-        bucket = 30
-    elif a < 50:
-        bucket = 40
-    elif a < 60:
-        bucket = 50
-    elif a < 70:
-        bucket = 60
-    else:
-        bucket = 70
-    sex_key = 'Man' if sex == 'Man' else 'Vrouw'
-    try:
-        ref = _REF_VALUES[sex_key][bucket]
-    except Exception:
-        return None, None, None
-    p95 = ref['p95']
-    p75 = ref['p75']
-    p50 = ref['p50']
-    p25 = ref['p25']
-    p5 = ref['p5']
+    return min(max(a // 10 * 10, 20), 70)
+
+
+def vo2_percentile_and_label(sex: str, age: float, vo2_mlkg: float) -> Vo2Percentile:
+    return _vo2_percentile_and_label(_sex_key(sex), _age_bucket(age), vo2_mlkg)
+
+
+@lru_cache(maxsize=1024)
+def _vo2_percentile_and_label(sex_key: str, bucket: int, vo2_mlkg: float) -> Vo2Percentile:
+    # Keyed on the normalised sex/bucket so Streamlit reruns with unchanged inputs hit the cache.
+    p95, p75, p50, p25, p5 = _REF_VALUES[sex_key][bucket]
     try:
-        percent_vs50 = round((float(vo2_mlkg) / float(p50)) * 100, 1)
-    except Exception:
+        percent_vs50 = round((float(vo2_mlkg) / p50) * 100, 1)
+    except (TypeError, ValueError):
         percent_vs50 = None
-    band = None
-    band_text = None
-    if vo2_mlkg >= p95:
-        band = ">=95%"
-        band_text = "Uitstekende inspanningscapaciteit"
-    elif vo2_mlkg >= p75:
-        band = "75-95%"
-        band_text = "Bovengemiddelde inspanningscapaciteit"
-    elif vo2_mlkg >= p25:
-        band = "25-75%"
-        band_text = "Normale inspanningscapaciteit"
-    elif vo2_mlkg >= p5:
-        band = "5-25%"
-        band_text = "Ondergemiddelde inspanningscapaciteit"
-    else:
-        band = "<5%"
-        band_text = "Slechte inspanningscapaciteit"
+    if math.isnan(vo2_mlkg):
+        return percent_vs50, None, None
+    band, band_text = _VO2_BANDS[bisect_right((p5, p25, p75, p95), vo2_mlkg)]
     return percent_vs50, band, band_text
 
 
-def get_vo2_reference_values(sex: str, age: float):
+def get_vo2_reference_values(sex: str, age: float) -> Optional[Dict[str, float]]:
     """Return the reference percentile dict for the provided sex/age bucket."""
-    try:
-        a = int(age)
-    except Exception:
-        a = 50
-    if a < 20:
-        bucket = 20
-    elif a < 30:
-        bucket = 20
-    elif a < 40:
-        bucket = 30
-    elif a < 50:
-        bucket = 40
-    elif a < 60:
-        bucket = 50
-    elif a < 70:
-        bucket = 60
-    else:
-        bucket = 70
-    sex_key = 'Man' if sex == 'Man' else 'Vrouw'
-    return _REF_VALUES.get(sex_key, {}).get(bucket)
+    ref = _REF_VALUES[_sex_key(sex)].get(_age_bucket(age))
+    return dict(zip(_REF_PERCENTILES, ref)) if ref else None
+
+
+def get_vo2_reference_p50(sex: str, age: float) -> float:
+    """Return the median (p50) VO2 reference for the sex/age bucket without building a dict."""
+    return _REF_VALUES[_sex_key(sex)][_age_bucket(age)][2]
 
 
 def mitral_regurgitation_severity(eroa: Optional[float], regurgitant_volume: Optional[float], regurgitant_fraction: Optional[float]) -> int:
-    """Return a coarse MR severity class (0 none → 3 severe)."""
-    severity = 0
-    try:
-        if eroa is not None:
-            if eroa >= 0.4:
-                severity = max(severity, 3)
-            elif 0.2 <= eroa < 0.4:
-                severity = max(severity, 2)
-            elif eroa < 0.2:
-                severity = max(severity, 1)
-        if regurgitant_volume is not None:
-            if regurgitant_volume >= 60:
-                severity = max(severity, 3)
-            elif 30 <= regurgitant_volume < 60:
-                severity = max(severity, 2)
-            elif regurgitant_volume < 30:
-                severity = max(severity, 1)
-        if regurgitant_fraction is not None:
-            if regurgitant_fraction > 50:
-                severity = max(severity, 3)
-            elif 30 <= regurgitant_fraction <= 50:
-                severity = max(severity, 2)
-            elif regurgitant_fraction < 30:
-                severity = max(severity, 1)
-    except Exception:
-        pass
-    return severity
+    """Return a coarse MR severity class (0 none → 3 severe).
+
+    Each available parameter grades 1-3; the worst grade wins. Missing (None/NaN)
+    parameters are ignored.
+    """
+    grades = [
+        bisect_right(bounds, value) + 1
+        for value, bounds in zip((eroa, regurgitant_volume, regurgitant_fraction), _MR_BOUNDS)
+        if value is not None and not math.isnan(value)
+    ]
+    return max(grades, default=0)
@@ -1,10 +1,25 @@
 """CIED follow-up reporting helpers."""
 from __future__ import annotations
 
+from dataclasses import fields
 from typing import Any, Dict, List, Optional, Union
 
 from cardiac_report.models import CIEDReportInput, LeadMeasurements, PatientContext
 
+# Field names resolved once; the coercers below read dict payloads by these names.
+_PATIENT_FIELDS = tuple(f.name for f in fields(PatientContext))
+_LEAD_FIELDS = tuple(f.name for f in fields(LeadMeasurements))
+_CIED_NESTED_FIELDS = frozenset({"patient", "atrial_fields", "vent_fields", "lv_fields"})
+# Flags are coerced with bool() and fall back to their dataclass default when absent.
+_CIED_FLAG_FIELDS = tuple(
+    (f.name, f.default) for f in fields(CIEDReportInput) if isinstance(f.default, bool)
+)
+_CIED_VALUE_FIELDS = tuple(
+    f.name
+    for f in fields(CIEDReportInput)
+    if f.name not in _CIED_NESTED_FIELDS and not isinstance(f.default, bool)
+)
+
 
 def _join_nl(items: List[str]) -> str:
     items = [str(i) for i in items if i and str(i).strip() != ""]
@@ -17,60 +32,69 @@ def _join_nl(items: List[str]) -> str:
     return f"{', '.join(items[:-1])} en {items[-1]}"
 
 
-def _parse_pct(value: Any) -> Optional[int]:
-    try:
-        if value is None:
-            return None
-        txt = str(value).strip()
-        if txt == "":
-            return None
-        return int(float(txt))
-    except Exception:
-        return None
-
-
 def _parse_int_nullable(value: Any) -> Optional[int]:
-    try:
-        if value is None:
+    """Parse a form value (int, float or numeric text) to an int; None when empty or invalid."""
+    if value is None:
+        return None
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is float:
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
             return None
+    try:
         txt = str(value).strip()
-        if txt == "":
-            return None
-        return int(float(txt))
+        return int(float(txt)) if txt else None
     except Exception:
         return None
 
 
-def _have_values(*fields: Any) -> bool:
-    try:
-        for field in fields:
-            if field is not None and str(field).strip() != "":
-                return True
-    except Exception:
-        return False
-    return False
-
-
 def _clean_str(value: Any, default: str = "n.v.t.") -> str:
+    if value is None:
+        return default
+    if type(value) is str:
+        return value.strip() or default
     try:
-        if value is None:
-            return default
-        txt = str(value).strip()
-        return txt if txt else default
+        return str(value).strip() or default
     except Exception:
         return default
 
 
 def _optional_str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if type(value) is str:
+        return value.strip() or None
     try:
-        if value is None:
-            return None
-        txt = str(value).strip()
-        return txt if txt else None
+        return str(value).strip() or None
     except Exception:
         return None
 
 
+def _have_values(*fields: Any) -> bool:
+    """Return True when any field holds a non-blank value."""
+    return any(
+        field.strip() if type(field) is str else _optional_str(field) is not None for field in fields
+    )
+
+
+def _render_lead(label: str, lead: LeadMeasurements) -> Optional[str]:
+    """Return the measurement line for one lead, or None when nothing was measured."""
+    if not _have_values(lead.sensing, lead.threshold_v, lead.threshold_ms, lead.impedance):
+        return None
+    sens = _clean_str(lead.sensing)
+    thr_v = _clean_str(lead.threshold_v)
+    thr_ms = _clean_str(lead.threshold_ms)
+    imp = _clean_str(lead.impedance)
+    pol = lead.polarity or "n.v.t."
+    stab = "stabiel" if lead.stable is not False else "onstabiel"
+    loc = _optional_str(lead.location)
+    loc_txt = f" Locatie: {loc}." if loc else ""
+    return f"{label}: sensing {sens} mV, drempel {thr_v} V @ {thr_ms} ms ({pol}), impedantie {imp} Ω, {stab}.{loc_txt}"
+
+
 def _coerce_patient(value: Any) -> Optional[PatientContext]:
     if isinstance(value, PatientContext):
         return value
@@ -79,16 +103,7 @@ def _coerce_patient(value: Any) -> Optional[PatientContext]:
             sex = value.get("sex")
             if not sex:
                 return None
-            return PatientContext(
-                sex=sex,
-                patient_id=value.get("patient_id"),
-                full_name=value.get("full_name"),
-                date_of_birth=value.get("date_of_birth"),
-                leeftijd=value.get("leeftijd"),
-                bsa=value.get("bsa"),
-                weight=value.get("weight"),
-                length=value.get("length"),
-            )
+            return PatientContext(**{name: value.get(name) for name in _PATIENT_FIELDS})
         except Exception:
             return None
     return None
@@ -98,15 +113,7 @@ def _coerce_lead_fields(data: Any) -> LeadMeasurements:
     if isinstance(data, LeadMeasurements):
         return data
     if isinstance(data, dict):
-        return LeadMeasurements(
-            sensing=data.get("sensing"),
-            impedance=data.get("impedance"),
-            threshold_v=data.get("threshold_v"),
-            threshold_ms=data.get("threshold_ms"),
-            polarity=data.get("polarity"),
-            stable=data.get("stable"),
-            location=data.get("location"),
-        )
+        return LeadMeasurements(**{name: data.get(name) for name in _LEAD_FIELDS})
     return LeadMeasurements()
 
 
@@ -116,35 +123,15 @@ def _coerce_cied_input(raw: Union[CIEDReportInput, Dict[str, Any]]) -> CIEDRepor
     if not isinstance(raw, dict):
         raise TypeError("CIED context must be a dataclass or dict")
 
+    values: Dict[str, Any] = {name: raw.get(name) for name in _CIED_VALUE_FIELDS}
+    for name, default in _CIED_FLAG_FIELDS:
+        values[name] = bool(raw.get(name, default))
     return CIEDReportInput(
         patient=_coerce_patient(raw.get("patient")),
-        device_type=raw.get("device_type"),
-        device_brand=raw.get("device_brand"),
-        programming_mode=raw.get("programming_mode"),
-        lower_rate=raw.get("lower_rate"),
-        upper_tracking=raw.get("upper_tracking"),
-        indication_text=raw.get("indication_text"),
-        lead_ra=bool(raw.get("lead_ra")),
-        lead_rv=bool(raw.get("lead_rv")),
-        lead_lv=bool(raw.get("lead_lv")),
-        other_leads=raw.get("other_leads"),
-        sensing_ok=bool(raw.get("sensing_ok", True)),
-        pacing_ok=bool(raw.get("pacing_ok", True)),
-        impedance_ok=bool(raw.get("impedance_ok", True)),
-        egm_events=raw.get("egm_events"),
-        atrial_pacing_pct=raw.get("atrial_pacing_pct"),
-        ventricular_pacing_pct=raw.get("ventricular_pacing_pct"),
-        lv_pacing_pct=raw.get("lv_pacing_pct"),
-        settings_changed=bool(raw.get("settings_changed", False)),
-        patient_dependent=bool(raw.get("patient_dependent", False)),
-        battery_status=raw.get("battery_status"),
-        suggested_sensed_av=raw.get("suggested_sensed_av"),
-        suggested_paced_av=raw.get("suggested_paced_av"),
-        sensed_av_delay=raw.get("sensed_av_delay"),
-        paced_av_delay=raw.get("paced_av_delay"),
         atrial_fields=_coerce_lead_fields(raw.get("atrial_fields")),
         vent_fields=_coerce_lead_fields(raw.get("vent_fields")),
         lv_fields=_coerce_lead_fields(raw.get("lv_fields")),
+        **values,
     )
 
 
@@ -185,74 +172,25 @@ def generate_cied_report(ctx: Union[CIEDReportInput, Dict[str, Any]]) -> str:
     except Exception:
         prog_str = ""
 
-    indic = indication_text if indication_text else ""
-    first_sentence = f"Correcte werking van {device_type} ({device_brand})"
-    if prog_str:
-        first_sentence += f" modus {prog_str}"
-    if indic:
-        first_sentence += f" ter behandeling van {indic}."
-    else:
-        first_sentence += "."
+    mode_txt = f" modus {prog_str}" if prog_str else ""
+    indic_txt = f" ter behandeling van {indication_text}." if indication_text else "."
+    first_sentence = f"Correcte werking van {device_type} ({device_brand}){mode_txt}{indic_txt}"
 
     meet_lines: List[str] = []
 
-    if lead_ra and _have_values(
-        atrial_fields.sensing,
-        atrial_fields.threshold_v,
-        atrial_fields.threshold_ms,
-        atrial_fields.impedance,
+    for label, enabled, lead in (
+        ("Atrium", lead_ra, atrial_fields),
+        ("Ventrikel", lead_rv, vent_fields),
+        ("LV", lead_lv, lv_fields),
     ):
-        a_sens = _clean_str(atrial_fields.sensing)
-        a_thr_v = _clean_str(atrial_fields.threshold_v)
-        a_thr_ms = _clean_str(atrial_fields.threshold_ms)
-        a_imp = _clean_str(atrial_fields.impedance)
-        a_pol = atrial_fields.polarity or "n.v.t."
-        a_stab = "stabiel" if atrial_fields.stable is not False else "onstabiel"
-        a_loc = _optional_str(atrial_fields.location)
-        loc_txt = f" Locatie: {a_loc}." if a_loc else ""
-        meet_lines.append(
-            f"Atrium: sensing {a_sens} mV, drempel {a_thr_v} V @ {a_thr_ms} ms ({a_pol}), impedantie {a_imp} Ω, {a_stab}.{loc_txt}"
-        )
-
-    if lead_rv and _have_values(
-        vent_fields.sensing,
-        vent_fields.threshold_v,
-        vent_fields.threshold_ms,
-        vent_fields.impedance,
-    ):
-        v_sens = _clean_str(vent_fields.sensing)
-        v_thr_v = _clean_str(vent_fields.threshold_v)
-        v_thr_ms = _clean_str(vent_fields.threshold_ms)
-        v_imp = _clean_str(vent_fields.impedance)
-        v_pol = vent_fields.polarity or "n.v.t."
-        v_stab = "stabiel" if vent_fields.stable is not False else "onstabiel"
-        v_loc = _optional_str(vent_fields.location)
-        loc_txt = f" Locatie: {v_loc}." if v_loc else ""
-        meet_lines.append(
-            f"Ventrikel: sensing {v_sens} mV, drempel {v_thr_v} V @ {v_thr_ms} ms ({v_pol}), impedantie {v_imp} Ω, {v_stab}.{loc_txt}"
-        )
-
-    if lead_lv and _have_values(
-        lv_fields.sensing,
-        lv_fields.threshold_v,
-        lv_fields.threshold_ms,
-        lv_fields.impedance,
-    ):
-        lv_sens = _clean_str(lv_fields.sensing)
-        lv_thr_v = _clean_str(lv_fields.threshold_v)
-        lv_thr_ms = _clean_str(lv_fields.threshold_ms)
-        lv_imp = _clean_str(lv_fields.impedance)
-        lv_pol = lv_fields.polarity or "n.v.t."
-        lv_stab = "stabiel" if lv_fields.stable is not False else "onstabiel"
-        lv_loc = _optional_str(lv_fields.location)
-        loc_txt = f" Locatie: {lv_loc}." if lv_loc else ""
-        meet_lines.append(
-            f"LV: sensing {lv_sens} mV, drempel {lv_thr_v} V @ {lv_thr_ms} ms ({lv_pol}), impedantie {lv_imp} Ω, {lv_stab}.{loc_txt}"
-        )
-
-    ap = _parse_pct(atrial_pacing_pct)
-    vp = _parse_pct(ventricular_pacing_pct)
-    lp = _parse_pct(lv_pacing_pct)
+        if enabled:
+            line = _render_lead(label, lead)
+            if line:
+                meet_lines.append(line)
+
+    ap = _parse_int_nullable(atrial_pacing_pct)
+    vp = _parse_int_nullable(ventricular_pacing_pct)
+    lp = _parse_int_nullable(lv_pacing_pct)
     pacing_parts: List[str] = []
     if ap is not None:
         pacing_parts.append(f"Atrium {ap}%")
@@ -263,40 +201,23 @@ def generate_cied_report(ctx: Union[CIEDReportInput, Dict[str, Any]]) -> str:
     if pacing_parts:
         meet_lines.append("Pacing percentages: " + ", ".join(pacing_parts) + ".")
 
-    ss_val = _parse_int_nullable(sensed_av_delay)
-    if ss_val is not None:
-        if suggested_sensed_av is not None:
-            meet_lines.append(
-                f"Sensed AV delay: {ss_val} ms (Rate-adaptive AV delay at peak UTR: {suggested_sensed_av} ms)."
-            )
-        else:
-            meet_lines.append(f"Sensed AV delay: {ss_val} ms.")
-
-    ps_val = _parse_int_nullable(paced_av_delay)
-    if ps_val is not None:
-        if suggested_paced_av is not None:
-            meet_lines.append(
-                f"Paced AV delay: {ps_val} ms (Rate-adaptive AV delay at peak UTR: {suggested_paced_av} ms)."
-            )
-        else:
-            meet_lines.append(f"Paced AV delay: {ps_val} ms.")
+    for label, delay_value, suggested in (
+        ("Sensed", sensed_av_delay, suggested_sensed_av),
+        ("Paced", paced_av_delay, suggested_paced_av),
+    ):
+        delay = _parse_int_nullable(delay_value)
+        if delay is None:
+            continue
+        suffix = f" (Rate-adaptive AV delay at peak UTR: {suggested} ms)" if suggested is not None else ""
+        meet_lines.append(f"{label} AV delay: {delay} ms{suffix}.")
 
     conclusion_parts: List[str] = []
     conclusion_parts.append(first_sentence)
 
-    sp_parts: List[str] = []
-    if sensing_ok:
-        sp_parts.append("sensing")
-    else:
-        sp_parts.append("sensing: afwijkend")
-    if pacing_ok:
-        sp_parts.append("pacing")
-    else:
-        sp_parts.append("pacing: afwijkend")
-    if impedance_ok:
-        sp_parts.append("impedantie")
-    else:
-        sp_parts.append("impedantie: afwijkend")
+    sp_parts = [
+        name if ok else f"{name}: afwijkend"
+        for name, ok in (("sensing", sensing_ok), ("pacing", pacing_ok), ("impedantie", impedance_ok))
+    ]
     conclusion_parts.append("Goede en stabiele waardes voor " + _join_nl(sp_parts) + ".")
 
     if egm_events and egm_events != "Geen events":
@@ -304,17 +225,14 @@ def generate_cied_report(ctx: Union[CIEDReportInput, Dict[str, Any]]) -> str:
     else:
         conclusion_parts.append("De EGM uitlezing toont geen events.")
 
-    if settings_changed:
-        conclusion_parts.append("Instellingen gewijzigd tijdens follow-up.")
-    else:
-        conclusion_parts.append("Instellingen ongewijzigd.")
-
-    if patient_dependent:
-        conclusion_parts.append("Patiënt is pacemakerafhankelijk.")
-    else:
-        conclusion_parts.append("Patiënt is niet afhankelijk.")
+    conclusion_parts.append(
+        "Instellingen gewijzigd tijdens follow-up." if settings_changed else "Instellingen ongewijzigd."
+    )
+    conclusion_parts.append(
+        "Patiënt is pacemakerafhankelijk." if patient_dependent else "Patiënt is niet afhankelijk."
+    )
 
-    batt_txt = battery_status.strip() if battery_status and battery_status.strip() != "" else "Batterijstatus niet gerapporteerd"
+    batt_txt = battery_status.strip() or "Batterijstatus niet gerapporteerd"
     conclusion_parts.append(f"Batterij: {batt_txt}.")
 
     final_parts: List[str] = []
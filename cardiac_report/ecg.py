@@ -1,11 +1,19 @@
 """ECG metrics calculation and reporting helpers."""
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from cardiac_report.models import ECGMeasurements, ECGMetrics
 
 
+@lru_cache(maxsize=256)
+def _rr_roots(vent_rate: float) -> Tuple[float, float]:
+    """Return (sqrt(RR), cbrt(RR)) for a heart rate; RR in seconds. Rates repeat, so cache."""
+    rr = 60.0 / vent_rate
+    return rr ** 0.5, rr ** (1.0 / 3.0)
+
+
 def compute_ecg_metrics(measurements: ECGMeasurements) -> ECGMetrics:
     """Derive convenience metrics for the ECG UI."""
 
@@ -16,10 +24,10 @@ def compute_ecg_metrics(measurements: ECGMeasurements) -> ECGMetrics:
     qtcf = None
     if measurements.qt_interval_ms is not None and measurements.vent_rate is not None:
         try:
-            rr = 60.0 / float(measurements.vent_rate)  # RR interval in seconds
+            sqrt_rr, cbrt_rr = _rr_roots(float(measurements.vent_rate))
             qt_raw = float(measurements.qt_interval_ms)
-            qtcb = round(qt_raw / (rr ** 0.5), 1)  # Bazett
-            qtcf = round(qt_raw / (rr ** (1.0 / 3.0)), 1)  # Fridericia
+            qtcb = round(qt_raw / sqrt_rr, 1)  # Bazett
+            qtcf = round(qt_raw / cbrt_rr, 1)  # Fridericia
         except Exception:
             qtcb = None
             qtcf = None
@@ -80,59 +88,65 @@ def compute_ecg_metrics(measurements: ECGMeasurements) -> ECGMetrics:
 def generate_ecg_report(measurements: ECGMeasurements, metrics: ECGMetrics) -> str:
     """Generate a textual ECG report based on captured measurements."""
 
+    recorded_at = measurements.recorded_at
+    rhythm_summary = measurements.rhythm_summary
+    vent_rate = measurements.vent_rate
+    pr_ms = measurements.pr_interval_ms
+    qrs_ms = measurements.qrs_duration_ms
+    qt_ms = measurements.qt_interval_ms
+    p_axis = measurements.p_axis_deg
+    qrs_axis = measurements.qrs_axis_deg
+    auto_report_text = measurements.auto_report_text
+    qtcb = metrics.qtcb_ms
+    qtcf = metrics.qtcf_ms
+    axis_deviation = metrics.axis_deviation
+
     lines: List[str] = []
-    if measurements.recorded_at:
-        lines.append(f"ECG geregistreerd op {measurements.recorded_at}.")
+    if recorded_at:
+        lines.append(f"ECG geregistreerd op {recorded_at}.")
     else:
         # Default succinct text for routine normal ECGs
         lines.append("Normaal sinusaal ritme.")
 
-    if measurements.rhythm_summary:
-        lines.append(f"Ritme: {measurements.rhythm_summary}.")
+    if rhythm_summary:
+        lines.append(f"Ritme: {rhythm_summary}.")
 
     interval_parts: List[str] = []
-    if measurements.vent_rate is not None:
-        interval_parts.append(f"Frequentie {measurements.vent_rate:.0f} bpm")
-    if measurements.pr_interval_ms is not None:
-        interval_parts.append(f"PR {measurements.pr_interval_ms:.0f} ms")
-    if measurements.qrs_duration_ms is not None:
-        interval_parts.append(f"QRS {measurements.qrs_duration_ms:.0f} ms")
-    if measurements.qt_interval_ms is not None:
-        qt_line = f"QT {measurements.qt_interval_ms:.0f} ms"
-        if metrics.qtcb_ms is not None and metrics.qtcf_ms is not None:
-            qt_line += f" (QTcB {metrics.qtcb_ms:.0f} ms; QTcF {metrics.qtcf_ms:.0f} ms)"
-        elif metrics.qtcf_ms is not None:
-            qt_line += f" (QTcF {metrics.qtcf_ms:.0f} ms)"
-        elif metrics.qtcb_ms is not None:
-            qt_line += f" (QTcB {metrics.qtcb_ms:.0f} ms)"
+    if vent_rate is not None:
+        interval_parts.append(f"Frequentie {vent_rate:.0f} bpm")
+    if pr_ms is not None:
+        interval_parts.append(f"PR {pr_ms:.0f} ms")
+    if qrs_ms is not None:
+        interval_parts.append(f"QRS {qrs_ms:.0f} ms")
+    if qt_ms is not None:
+        qt_line = f"QT {qt_ms:.0f} ms"
+        if qtcb is not None and qtcf is not None:
+            qt_line += f" (QTcB {qtcb:.0f} ms; QTcF {qtcf:.0f} ms)"
+        elif qtcf is not None:
+            qt_line += f" (QTcF {qtcf:.0f} ms)"
+        elif qtcb is not None:
+            qt_line += f" (QTcB {qtcb:.0f} ms)"
         interval_parts.append(qt_line)
     if interval_parts:
         lines.append(", ".join(interval_parts) + ".")
 
-    axis_parts: List[str] = []
-    if measurements.p_axis_deg is not None:
-        axis_parts.append(f"P-as {measurements.p_axis_deg:.0f}°")
-    if measurements.qrs_axis_deg is not None:
-        axis_parts.append(f"QRS-as {measurements.qrs_axis_deg:.0f}°")
-    if measurements.t_axis_deg is not None:
-        axis_parts.append(f"T-as {measurements.t_axis_deg:.0f}°")
     # Do not include acquisition device or T-axis in the textual report per user preference
     # Only include P-axis and QRS-axis (if present)
     axis_filtered: List[str] = []
-    if measurements.p_axis_deg is not None:
-        axis_filtered.append(f"P-as {measurements.p_axis_deg:.0f}°")
-    if measurements.qrs_axis_deg is not None:
-        axis_filtered.append(f"QRS-as {measurements.qrs_axis_deg:.0f}°")
+    if p_axis is not None:
+        axis_filtered.append(f"P-as {p_axis:.0f}°")
+    if qrs_axis is not None:
+        axis_filtered.append(f"QRS-as {qrs_axis:.0f}°")
     if axis_filtered:
         lines.append(", ".join(axis_filtered) + ".")
 
-    if metrics.axis_deviation and metrics.axis_deviation not in lines[-1]:  # avoid duplicate sentences
-        lines.append(metrics.axis_deviation + ".")
+    if axis_deviation and axis_deviation not in lines[-1]:  # avoid duplicate sentences
+        lines.append(axis_deviation + ".")
 
-    if measurements.auto_report_text:
+    if auto_report_text:
         lines.append("")
         lines.append("Automatische protocolering:")
-        lines.append(measurements.auto_report_text.strip())
+        lines.append(auto_report_text.strip())
 
     if metrics.tachy_flag:
         lines.append("Frequentie in tachycard bereik (>100 bpm).")
@@ -145,30 +159,40 @@ def generate_ecg_report(measurements: ECGMeasurements, metrics: ECGMetrics) -> s
 def summarize_ecg_for_brief(measurements: ECGMeasurements, metrics: ECGMetrics) -> str:
     """Return a short ECG summary for inclusion in the consult brief."""
 
+    recorded_at = measurements.recorded_at
+    rhythm = (measurements.rhythm_summary or "").strip()
+    vent_rate = measurements.vent_rate
+    qrs_ms = measurements.qrs_duration_ms
+    p_duration_ms = measurements.p_duration_ms
+    qt_ms = measurements.qt_interval_ms
+    qtcb = metrics.qtcb_ms
+    qtcf = metrics.qtcf_ms
+    axis_deviation = metrics.axis_deviation
+
     parts: List[str] = []
-    if measurements.rhythm_summary:
-        parts.append(measurements.rhythm_summary.strip())
-    if measurements.vent_rate is not None:
-        parts.append(f"HF {measurements.vent_rate:.0f} bpm")
-    if measurements.qrs_duration_ms is not None:
-        parts.append(f"QRS {measurements.qrs_duration_ms:.0f} ms")
-    if measurements.p_duration_ms is not None:
-        parts.append(f"P duur {measurements.p_duration_ms:.0f} ms")
-    if metrics.qtcb_ms is not None and metrics.qtcf_ms is not None:
-        parts.append(f"QTcB {metrics.qtcb_ms:.0f} ms")
-        parts.append(f"QTcF {metrics.qtcf_ms:.0f} ms")
-    elif metrics.qtcf_ms is not None:
-        parts.append(f"QTcF {metrics.qtcf_ms:.0f} ms")
-    elif metrics.qtcb_ms is not None:
-        parts.append(f"QTcB {metrics.qtcb_ms:.0f} ms")
-    elif measurements.qt_interval_ms is not None:
-        parts.append(f"QT {measurements.qt_interval_ms:.0f} ms")
-    if metrics.axis_deviation:
-        parts.append(metrics.axis_deviation)
-
-    text = "; ".join(part for part in parts if part)
-    if measurements.recorded_at:
-        prefix = f"ECG dd. {measurements.recorded_at}: "
+    if rhythm:
+        parts.append(rhythm)
+    if vent_rate is not None:
+        parts.append(f"HF {vent_rate:.0f} bpm")
+    if qrs_ms is not None:
+        parts.append(f"QRS {qrs_ms:.0f} ms")
+    if p_duration_ms is not None:
+        parts.append(f"P duur {p_duration_ms:.0f} ms")
+    if qtcb is not None and qtcf is not None:
+        parts.append(f"QTcB {qtcb:.0f} ms")
+        parts.append(f"QTcF {qtcf:.0f} ms")
+    elif qtcf is not None:
+        parts.append(f"QTcF {qtcf:.0f} ms")
+    elif qtcb is not None:
+        parts.append(f"QTcB {qtcb:.0f} ms")
+    elif qt_ms is not None:
+        parts.append(f"QT {qt_ms:.0f} ms")
+    if axis_deviation:
+        parts.append(axis_deviation)
+
+    text = "; ".join(parts)
+    if recorded_at:
+        prefix = f"ECG dd. {recorded_at}: "
     else:
         prefix = "ECG: " if text else ""
     summary = (prefix + text).strip()
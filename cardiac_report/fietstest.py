@@ -1,32 +1,61 @@
 """Fietstest (bicycle stress test) domain helpers."""
 from __future__ import annotations
 
-from typing import List, Optional
+import math
+from typing import Any, List, Optional
 
-from cardiac_report.calculations import get_vo2_reference_values, vo2_percentile_and_label
+from cardiac_report.calculations import get_vo2_reference_p50, vo2_percentile_and_label
 from cardiac_report.models import FietstestMeasurements, FietstestMetrics
 
 
+def _as_float(value: Any) -> Optional[float]:
+    """Return `value` as a float; None when missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _percent_of(value: Any, reference: Optional[float]) -> Optional[float]:
+    """Return `value` as a percentage of `reference`; None unless both are positive."""
+    number = _as_float(value)
+    if not (number and number > 0 and reference and reference > 0):
+        return None
+    return round((number / reference) * 100, 1)
+
+
+def _predicted_watts(weight: Any, p50: float) -> Optional[float]:
+    """Return the wattage at which a patient of `weight` kg reaches the median VO2."""
+    kg = _as_float(weight)
+    if not (kg and kg > 0):
+        return None
+    work_rate_pred = kg * (p50 - 7.0) / 1.8
+    if not work_rate_pred > 0:
+        return None
+    return round(work_rate_pred / 6.12, 1)
+
+
 def calculate_predicted_max_hr(age: Optional[float]) -> Optional[int]:
     """Return Tanaka-derived predicted max HR."""
-    try:
-        if age is None:
-            return None
-        return int(round(208 - 0.7 * float(age)))
-    except Exception:
+    age_years = _as_float(age)
+    if age_years is None or not math.isfinite(age_years):
         return None
+    return int(round(208 - 0.7 * age_years))
 
 
 def calculate_vo2_from_watts(max_watt: Optional[float], weight: Optional[float]) -> Optional[float]:
     """Convert achieved wattage to estimated VO2 (ml·kg⁻¹·min⁻¹)."""
-    try:
-        if not max_watt or not weight or float(weight) <= 0:
-            return None
-        work_rate = float(max_watt) * 6.12  # kg·m·min⁻¹
-        vo2 = 1.8 * work_rate / float(weight) + 7
-        return round(vo2, 1)
-    except Exception:
+    if not max_watt or not weight:
         return None
+    watt = _as_float(max_watt)
+    kg = _as_float(weight)
+    if watt is None or kg is None or kg <= 0:
+        return None
+    work_rate = watt * 6.12  # kg·m·min⁻¹
+    vo2 = 1.8 * work_rate / kg + 7
+    return round(vo2, 1)
 
 
 def compute_fietstest_metrics(params: FietstestMeasurements) -> FietstestMetrics:
@@ -38,12 +67,7 @@ def compute_fietstest_metrics(params: FietstestMeasurements) -> FietstestMetrics
     max_hr = params.max_hr
 
     predicted_max_hr = calculate_predicted_max_hr(age)
-    pct_hr_display: Optional[float] = None
-    if predicted_max_hr and max_hr and float(max_hr) > 0:
-        try:
-            pct_hr_display = round((float(max_hr) / float(predicted_max_hr)) * 100, 1)
-        except Exception:
-            pct_hr_display = None
+    pct_hr_display = _percent_of(max_hr, predicted_max_hr)
 
     vo2_observed = calculate_vo2_from_watts(max_watt, weight)
     vo2_observed_text = f"Observed VO2: {vo2_observed} ml·kg⁻¹·min⁻¹" if vo2_observed is not None else ""
@@ -54,20 +78,8 @@ def compute_fietstest_metrics(params: FietstestMeasurements) -> FietstestMetrics
     if vo2_observed is not None:
         pct_vs50, band, band_text = vo2_percentile_and_label(sex, age, vo2_observed)
 
-    wpred = None
-    wpred_pct = None
-    try:
-        ref = get_vo2_reference_values(sex, age)
-        p50 = ref.get('p50') if ref else None
-        if p50 is not None and weight and float(weight) > 0:
-            work_rate_pred = float(weight) * (float(p50) - 7.0) / 1.8
-            if work_rate_pred > 0:
-                wpred = round(work_rate_pred / 6.12, 1)
-                if wpred and max_watt and float(wpred) > 0 and float(max_watt) > 0:
-                    wpred_pct = round((float(max_watt) / float(wpred)) * 100, 1)
-    except Exception:
-        wpred = None
-        wpred_pct = None
+    wpred = _predicted_watts(weight, get_vo2_reference_p50(sex, age))
+    wpred_pct = _percent_of(max_watt, wpred)
 
     summary_lines: List[str] = []
     if predicted_max_hr:
@@ -132,41 +144,33 @@ def generate_fietstest_report(params: FietstestMeasurements, metrics: FietstestM
         else "Maximale belasting niet bereikt of niet gerapporteerd."
     )
 
-    pct_text = ""
-    if predicted_max_hr and max_hr and max_hr > 0:
-        try:
-            pct_val = pct_hr_display if pct_hr_display is not None else None
-            if pct_val is None:
-                pct_val = round((float(max_hr) / float(predicted_max_hr)) * 100, 1)
-            pct_text = f" ({pct_val}% predicted)"
-        except Exception:
-            pct_text = ""
-
-    vo2_text = ""
+    # compute_fietstest_metrics already derived the percentage; only recompute for bare metrics.
+    pct_val = pct_hr_display if pct_hr_display is not None else _percent_of(max_hr, predicted_max_hr)
+    pct_text = f" ({pct_val}% predicted)" if pct_val is not None else ""
+
     if vo2_value is None:
         vo2_value = calculate_vo2_from_watts(max_watt, weight)
-    if vo2_value is not None:
-        vo2_text = f"VO2 (ml·kg⁻¹·min⁻¹): {vo2_value}"
-
-    report: List[str] = []
-    report.append(f"Start aan {start_watt} W. Opdrijven van de belasting met {increment_watt} W om de minuut.")
-    report.append(max_watt_text)
-    report.append(f"Maximale hartslag bedraagt {max_hr}/min{pct_text}")
-    report.append(f"{bp_evolutie}. {ritme}.")
-    report.append(f"{effort_type}. Het criterium voor staken betreft {stop_criterium}.")
-    report.append("")
-    report.append(f"Het ECG vertoont {ecg_changes} tijdens inspanning of recuperatie.")
-    report.append("")
-    report.append(f"Conclusie: {conclusion}.")
-
+    vo2_lines: List[str] = []
     if vo2_value is not None:
         if pct_vs50 is None or band is None or band_text is None:
-            vo2_line = vo2_text
+            vo2_lines.append(f"VO2 (ml·kg⁻¹·min⁻¹): {vo2_value}")
         else:
-            vo2_line = (
+            vo2_lines.append(
                 f"VO2: {vo2_value} ml·kg⁻¹·min⁻¹ ({pct_vs50}% predicted) — Percentiel: {band} ({band_text})"
             )
-        report.insert(3, vo2_line)
+
+    report = [
+        f"Start aan {start_watt} W. Opdrijven van de belasting met {increment_watt} W om de minuut.",
+        max_watt_text,
+        f"Maximale hartslag bedraagt {max_hr}/min{pct_text}",
+        *vo2_lines,
+        f"{bp_evolutie}. {ritme}.",
+        f"{effort_type}. Het criterium voor staken betreft {stop_criterium}.",
+        "",
+        f"Het ECG vertoont {ecg_changes} tijdens inspanning of recuperatie.",
+        "",
+        f"Conclusie: {conclusion}.",
+    ]
 
     return "\n".join(report)
 
@@ -174,22 +178,27 @@ def generate_fietstest_report(params: FietstestMeasurements, metrics: FietstestM
 def summarize_fietstest_for_brief(params: FietstestMeasurements, metrics: FietstestMetrics) -> str:
     """Return a compact fietsproef summary for the consult letter."""
 
+    max_watt = params.max_watt
+    max_hr = params.max_hr
+    conclusion = params.conclusion
+    pct_hr_display = metrics.pct_hr_display
+    vo2_observed = metrics.vo2_observed
+    vo2_percentile_pct = metrics.vo2_percentile_pct
+
     parts: List[str] = []
-    if params.max_watt:
-        parts.append(f"Max belasting {params.max_watt:.0f} W")
-    if params.max_hr:
-        if metrics.pct_hr_display is not None:
-            parts.append(f"HF {params.max_hr:.0f} bpm ({metrics.pct_hr_display:.0f}% voorspeld)")
+    if max_watt:
+        parts.append(f"Max belasting {max_watt:.0f} W")
+    if max_hr:
+        if pct_hr_display is not None:
+            parts.append(f"HF {max_hr:.0f} bpm ({pct_hr_display:.0f}% voorspeld)")
         else:
-            parts.append(f"HF {params.max_hr:.0f} bpm")
-    if metrics.vo2_observed is not None:
-        if metrics.vo2_percentile_pct is not None:
-            parts.append(
-                f"VO₂ {metrics.vo2_observed:.1f} ml·kg⁻¹·min⁻¹ ({metrics.vo2_percentile_pct:.0f}% vs p50)"
-            )
+            parts.append(f"HF {max_hr:.0f} bpm")
+    if vo2_observed is not None:
+        if vo2_percentile_pct is not None:
+            parts.append(f"VO₂ {vo2_observed:.1f} ml·kg⁻¹·min⁻¹ ({vo2_percentile_pct:.0f}% vs p50)")
         else:
-            parts.append(f"VO₂ {metrics.vo2_observed:.1f} ml·kg⁻¹·min⁻¹")
-    if params.conclusion:
-        parts.append(params.conclusion.strip())
+            parts.append(f"VO₂ {vo2_observed:.1f} ml·kg⁻¹·min⁻¹")
+    if conclusion:
+        parts.append(conclusion.strip())
 
     return "; ".join(part for part in parts if part) or "Geen fietsproefgegevens beschikbaar."
@@ -1,27 +1,36 @@
 """Utility helpers for formatting values in reports and the UI."""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from html import escape
+
+# Severity keywords per color, checked in priority order (a "niet gedilateerd" label is green).
+# normal/none -> green, mild -> yellow, moderate -> orange, severe/ernstig -> red
+_STATUS_COLORS = (
+    (re.compile("geen|niet|norm"), "green"),
+    (re.compile("mild"), "goldenrod"),
+    (re.compile("matig|moderate"), "orange"),
+    (re.compile("ernstig|severe|gedilateerd"), "red"),
+)
+
+
+def _status_color(low: str) -> str:
+    """Return the display color for a lowercased severity label."""
+    for pattern, color in _STATUS_COLORS:
+        if pattern.search(low):
+            return color
+    return 'black'
+
+
+@lru_cache(maxsize=256)
+def _status_span(text: str) -> str:
+    return f"<span style='color:{_status_color(text.lower())}; font-weight:600'>{escape(text)}</span>"
 
 
 def color_status_html(label: str) -> str:
     """Return HTML span with color coding for dilatation status."""
-    try:
-        if label is None:
-            return ""
-        text = str(label).strip()
-        low = text.lower()
-        # Map common severity labels to colors:
-        # normal/none -> green, mild -> yellow, moderate -> orange, severe/ernstig -> red
-        if any(x in low for x in ('geen', 'niet', 'norm', 'normal')):
-            color = 'green'
-        elif any(x in low for x in ('mild', 'milde')):
-            color = 'goldenrod'
-        elif any(x in low for x in ('matig', 'matig', 'moderate')):
-            color = 'orange'
-        elif any(x in low for x in ('ernstig', 'ernstige', 'severe')):
-            color = 'red'
-        elif 'gedilateerd' in low:
-            color = 'red'
-        else:
-            color = 'black'
-        return f"<span style='color:{color}; font-weight:600'>{text}</span>"
-    except Exception:
-        return str(label)
+    if label is None:
+        return ""
+    text = str(label).strip()
+    return _status_span(text) if text else ""
@@ -1,13 +1,17 @@
 """Holter monitoring domain helpers and report generation."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+import operator
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from cardiac_report.models import PatientContext
 
+# Field names resolved once; to_dict serialises the patient by these names.
+_PATIENT_FIELDS = tuple(f.name for f in fields(PatientContext))
 
-@dataclass
+
+@dataclass(slots=True)
 class HolterMeasurements:
     """Structured input for Holter monitoring interpretation."""
 
@@ -35,19 +39,31 @@ class HolterMeasurements:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        result = asdict(self)
-        result["patient"] = asdict(self.patient)
-        return result
+        patient = self.patient
+        return {
+            "patient": {name: getattr(patient, name) for name in _PATIENT_FIELDS},
+            "recording_date": self.recording_date,
+            "recording_duration_hours": self.recording_duration_hours,
+            "avg_hr": self.avg_hr,
+            "min_hr": self.min_hr,
+            "max_hr": self.max_hr,
+            "afib_percentage": self.afib_percentage,
+            "pauses_count": self.pauses_count,
+            "longest_pause_ms": self.longest_pause_ms,
+            "ves_count": self.ves_count,
+            "sves_count": self.sves_count,
+            "av_block_type": self.av_block_type,
+            "other_findings": self.other_findings,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> HolterMeasurements:
-        """Create instance from dictionary."""
-        patient_data = data.pop("patient", {})
-        patient = PatientContext(**patient_data)
-        return cls(patient=patient, **data)
+        """Create instance from dictionary; `data` is not modified."""
+        patient = PatientContext(**data.get("patient", {}))
+        return cls(patient=patient, **{k: v for k, v in data.items() if k != "patient"})
 
 
-@dataclass
+@dataclass(slots=True)
 class HolterMetrics:
     """Derived metrics and summary for Holter monitoring."""
 
@@ -58,55 +74,58 @@ class HolterMetrics:
     frequent_ves: bool = False
     frequent_sves: bool = False
     av_block_detected: bool = False
-    summary_lines: List[str] = None
-
-    def __post_init__(self):
-        if self.summary_lines is None:
-            self.summary_lines = []
+    summary_lines: List[str] = field(default_factory=list)
+
+
+# (attribute, summary label, unit, comparison, threshold, metrics flag, suffix when flagged);
+# rules without a comparison only add the summary line.
+_Rule = Tuple[str, str, str, Optional[Callable[[Any, Any], bool]], Optional[int], Optional[str], str]
+_HR_RULES: Tuple[_Rule, ...] = (
+    ("avg_hr", "Gemiddelde hartfrequentie", " bpm", None, None, None, ""),
+    ("min_hr", "Minimale hartfrequentie", " bpm", operator.lt, 40, "brady_flag", " (bradycardie)"),
+    ("max_hr", "Maximale hartfrequentie", " bpm", operator.gt, 120, "tachy_flag", " (tachycardie)"),
+)
+_ECTOPY_RULES: Tuple[_Rule, ...] = (
+    ("ves_count", "VES", "", operator.gt, 1000, "frequent_ves", " (frequent)"),
+    ("sves_count", "SVES", "", operator.gt, 1000, "frequent_sves", " (frequent)"),
+)
+
+
+def _apply_rules(
+    measurements: HolterMeasurements, rules: Tuple[_Rule, ...], summary: List[str], flags: Dict[str, bool]
+) -> None:
+    for attr, label, unit, compare, threshold, flag, suffix in rules:
+        value = getattr(measurements, attr)
+        if value is None:
+            continue
+        flagged = compare(value, threshold) if compare else False
+        if flag:
+            flags[flag] = flagged
+        summary.append(f"{label}: {value}{unit}{suffix if flagged else ''}")
 
 
 def compute_holter_metrics(measurements: HolterMeasurements) -> HolterMetrics:
     """Derive convenience metrics for the Holter UI."""
 
     summary: List[str] = []
-    brady_flag = False
-    tachy_flag = False
-    afib_detected = False
-    significant_pauses = False
-    frequent_ves = False
-    frequent_sves = False
-    av_block_detected = False
+    flags: Dict[str, bool] = {}
 
     # Recording duration
     if measurements.recording_duration_hours:
         summary.append(f"Registratieduur: {measurements.recording_duration_hours} uur")
 
     # Heart rate analysis
-    if measurements.avg_hr is not None:
-        summary.append(f"Gemiddelde hartfrequentie: {measurements.avg_hr} bpm")
-    
-    if measurements.min_hr is not None:
-        brady_flag = measurements.min_hr < 40
-        min_hr_text = f"Minimale hartfrequentie: {measurements.min_hr} bpm"
-        if brady_flag:
-            min_hr_text += " (bradycardie)"
-        summary.append(min_hr_text)
-    
-    if measurements.max_hr is not None:
-        tachy_flag = measurements.max_hr > 120
-        max_hr_text = f"Maximale hartfrequentie: {measurements.max_hr} bpm"
-        if tachy_flag:
-            max_hr_text += " (tachycardie)"
-        summary.append(max_hr_text)
+    _apply_rules(measurements, _HR_RULES, summary, flags)
 
     # Atrial fibrillation
     if measurements.afib_percentage is not None and measurements.afib_percentage > 0:
-        afib_detected = True
+        flags["afib_detected"] = True
         summary.append(f"Atriumfibrilleren: {measurements.afib_percentage}% van de tijd")
 
     # Pauses
     if measurements.pauses_count is not None and measurements.pauses_count > 0:
         significant_pauses = measurements.longest_pause_ms and measurements.longest_pause_ms > 2000
+        flags["significant_pauses"] = significant_pauses
         pause_text = f"Pauzes: {measurements.pauses_count}"
         if measurements.longest_pause_ms:
             pause_text += f" (langste: {measurements.longest_pause_ms} ms)"
@@ -114,117 +133,115 @@ def compute_holter_metrics(measurements: HolterMeasurements) -> HolterMetrics:
             pause_text += " - significant"
         summary.append(pause_text)
 
-    # Ventricular ectopy
-    if measurements.ves_count is not None:
-        frequent_ves = measurements.ves_count > 1000
-        ves_text = f"VES: {measurements.ves_count}"
-        if frequent_ves:
-            ves_text += " (frequent)"
-        summary.append(ves_text)
-
-    # Supraventricular ectopy
-    if measurements.sves_count is not None:
-        frequent_sves = measurements.sves_count > 1000
-        sves_text = f"SVES: {measurements.sves_count}"
-        if frequent_sves:
-            sves_text += " (frequent)"
-        summary.append(sves_text)
+    # Ventricular and supraventricular ectopy
+    _apply_rules(measurements, _ECTOPY_RULES, summary, flags)
 
     # AV block
     if measurements.av_block_type:
-        av_block_detected = True
+        flags["av_block_detected"] = True
         summary.append(f"AV-blok: {measurements.av_block_type}")
 
-    return HolterMetrics(
-        brady_flag=brady_flag,
-        tachy_flag=tachy_flag,
-        afib_detected=afib_detected,
-        significant_pauses=significant_pauses,
-        frequent_ves=frequent_ves,
-        frequent_sves=frequent_sves,
-        av_block_detected=av_block_detected,
-        summary_lines=summary,
-    )
+    return HolterMetrics(summary_lines=summary, **flags)
 
 
 def generate_holter_report(measurements: HolterMeasurements, metrics: HolterMetrics) -> str:
     """Generate a textual Holter monitoring report based on captured measurements."""
 
+    recording_date = measurements.recording_date
+    duration_hours = measurements.recording_duration_hours
+    avg_hr = measurements.avg_hr
+    min_hr = measurements.min_hr
+    max_hr = measurements.max_hr
+    afib_pct = measurements.afib_percentage
+    pauses_count = measurements.pauses_count
+    longest_pause = measurements.longest_pause_ms
+    ves_count = measurements.ves_count
+    sves_count = measurements.sves_count
+    av_block_type = measurements.av_block_type
+    other_findings = (measurements.other_findings or "").strip()
+    brady = metrics.brady_flag
+    tachy = metrics.tachy_flag
+    afib_detected = metrics.afib_detected
+    significant_pauses = metrics.significant_pauses
+    frequent_ves = metrics.frequent_ves
+    frequent_sves = metrics.frequent_sves
+    av_block_detected = metrics.av_block_detected
+
     lines: List[str] = []
 
     # Header
-    if measurements.recording_date:
-        lines.append(f"Holter-monitoring geregistreerd op {measurements.recording_date}.")
+    if recording_date:
+        lines.append(f"Holter-monitoring geregistreerd op {recording_date}.")
     else:
         lines.append("Holter-monitoring registratie.")
 
-    if measurements.recording_duration_hours:
-        lines.append(f"Registratieduur: {measurements.recording_duration_hours} uur.")
+    if duration_hours:
+        lines.append(f"Registratieduur: {duration_hours} uur.")
 
     # Heart rate
     hr_parts: List[str] = []
-    if measurements.avg_hr is not None:
-        hr_parts.append(f"gemiddelde hartfrequentie {measurements.avg_hr} bpm")
-    if measurements.min_hr is not None:
-        hr_parts.append(f"minimum {measurements.min_hr} bpm")
-    if measurements.max_hr is not None:
-        hr_parts.append(f"maximum {measurements.max_hr} bpm")
+    if avg_hr is not None:
+        hr_parts.append(f"gemiddelde hartfrequentie {avg_hr} bpm")
+    if min_hr is not None:
+        hr_parts.append(f"minimum {min_hr} bpm")
+    if max_hr is not None:
+        hr_parts.append(f"maximum {max_hr} bpm")
     
     if hr_parts:
         lines.append("Hartfrequentie: " + ", ".join(hr_parts) + ".")
 
     # Bradycardie/tachycardie interpretation
-    if metrics.brady_flag:
+    if brady:
         lines.append("Er werd bradycardie vastgesteld.")
-    if metrics.tachy_flag:
+    if tachy:
         lines.append("Er werden episoden van tachycardie waargenomen.")
 
     # Rhythm analysis
     rhythm_findings: List[str] = []
 
     # Atrial fibrillation
-    if metrics.afib_detected and measurements.afib_percentage is not None:
-        if measurements.afib_percentage >= 50:
+    if afib_detected and afib_pct is not None:
+        if afib_pct >= 50:
             rhythm_findings.append(
-                f"Er werd permanent atriumfibrilleren vastgesteld ({measurements.afib_percentage}% van de tijd)."
+                f"Er werd permanent atriumfibrilleren vastgesteld ({afib_pct}% van de tijd)."
             )
-        elif measurements.afib_percentage >= 10:
+        elif afib_pct >= 10:
             rhythm_findings.append(
-                f"Er werden frequente episoden van atriumfibrilleren waargenomen ({measurements.afib_percentage}% van de tijd)."
+                f"Er werden frequente episoden van atriumfibrilleren waargenomen ({afib_pct}% van de tijd)."
             )
         else:
             rhythm_findings.append(
-                f"Er werden incidentele episoden van atriumfibrilleren waargenomen ({measurements.afib_percentage}% van de tijd)."
+                f"Er werden incidentele episoden van atriumfibrilleren waargenomen ({afib_pct}% van de tijd)."
             )
 
     # Pauses
-    if measurements.pauses_count is not None and measurements.pauses_count > 0:
-        pause_text = f"{measurements.pauses_count} pauze(s)"
-        if measurements.longest_pause_ms:
-            pause_text += f" met een maximale duur van {measurements.longest_pause_ms} ms"
-        if metrics.significant_pauses:
+    if pauses_count is not None and pauses_count > 0:
+        pause_text = f"{pauses_count} pauze(s)"
+        if longest_pause:
+            pause_text += f" met een maximale duur van {longest_pause} ms"
+        if significant_pauses:
             rhythm_findings.append(f"Er werden significante pauzes geregistreerd: {pause_text}.")
         else:
             rhythm_findings.append(f"Er werden {pause_text} geregistreerd.")
 
     # Ectopy
     ectopy_parts: List[str] = []
-    if measurements.ves_count is not None and measurements.ves_count > 0:
-        ves_descriptor = "frequente" if metrics.frequent_ves else ""
-        ectopy_parts.append(f"{ves_descriptor} ventriculaire extrasystolen (VES: {measurements.ves_count})".strip())
+    if ves_count is not None and ves_count > 0:
+        ves_descriptor = "frequente" if frequent_ves else ""
+        ectopy_parts.append(f"{ves_descriptor} ventriculaire extrasystolen (VES: {ves_count})".strip())
     
-    if measurements.sves_count is not None and measurements.sves_count > 0:
-        sves_descriptor = "frequente" if metrics.frequent_sves else ""
+    if sves_count is not None and sves_count > 0:
+        sves_descriptor = "frequente" if frequent_sves else ""
         ectopy_parts.append(
-            f"{sves_descriptor} supraventriculaire extrasystolen (SVES: {measurements.sves_count})".strip()
+            f"{sves_descriptor} supraventriculaire extrasystolen (SVES: {sves_count})".strip()
         )
 
     if ectopy_parts:
         rhythm_findings.append("Er werden " + " en ".join(ectopy_parts) + " waargenomen.")
 
     # AV block
-    if metrics.av_block_detected and measurements.av_block_type:
-        rhythm_findings.append(f"Er werd {measurements.av_block_type} vastgesteld.")
+    if av_block_detected and av_block_type:
+        rhythm_findings.append(f"Er werd {av_block_type} vastgesteld.")
 
     # No significant findings fallback
     if not rhythm_findings:
@@ -233,27 +250,27 @@ def generate_holter_report(measurements: HolterMeasurements, metrics: HolterMetr
     lines.extend(rhythm_findings)
 
     # Other findings
-    if measurements.other_findings and measurements.other_findings.strip():
-        lines.append(f"Overige bevindingen: {measurements.other_findings.strip()}.")
+    if other_findings:
+        lines.append(f"Overige bevindingen: {other_findings}.")
 
     # Conclusion
     lines.append("\nConclusie:")
     conclusions: List[str] = []
 
-    if metrics.afib_detected:
+    if afib_detected:
         conclusions.append("- Atriumfibrilleren gedocumenteerd")
-    if metrics.brady_flag:
+    if brady:
         conclusions.append("- Bradycardie")
-    if metrics.tachy_flag:
+    if tachy:
         conclusions.append("- Tachycardie")
-    if metrics.significant_pauses:
+    if significant_pauses:
         conclusions.append("- Significante pauzes")
-    if metrics.frequent_ves:
+    if frequent_ves:
         conclusions.append("- Frequente ventriculaire extrasystolen")
-    if metrics.frequent_sves:
+    if frequent_sves:
         conclusions.append("- Frequente supraventriculaire extrasystolen")
-    if metrics.av_block_detected:
-        conclusions.append(f"- {measurements.av_block_type}")
+    if av_block_detected:
+        conclusions.append(f"- {av_block_type}")
 
     if not conclusions:
         conclusions.append("- Geen afwijkingen geregistreerd tijdens Holter-monitoring")
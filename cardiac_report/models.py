@@ -1,13 +1,38 @@
 """Data models used across the cardiac report package."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
 SessionState = Dict[str, Any]
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _known_fields(cls: type, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the entries of `payload` that are fields of `cls`; unknown keys are dropped."""
+    return {name: payload[name] for name in _field_names(cls) if name in payload}
+
+
+def _shallow_asdict(obj: Any, drop: AbstractSet[str] = frozenset()) -> Dict[str, Any]:
+    """Like `dataclasses.asdict`, but without deep-copying field values.
+
+    Nested dataclasses become dicts; all other values are shared with `obj`.
+    """
+    data: Dict[str, Any] = {}
+    for name in _field_names(type(obj)):
+        if name in drop:
+            continue
+        value = getattr(obj, name)
+        data[name] = _shallow_asdict(value) if is_dataclass(value) else value
+    return data
+
+
+@dataclass(slots=True)
 class PatientContext:
     """Basic patient info that multiple modules depend on."""
 
@@ -21,7 +46,7 @@ class PatientContext:
     length: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EchoReportInput:
     """Structured payload for the echo interpretation engine."""
 
@@ -90,7 +115,7 @@ class EchoReportInput:
         return self.patient.leeftijd
 
 
-@dataclass
+@dataclass(slots=True)
 class FietstestMeasurements:
     """Structured input for bicycle stress test interpretation."""
 
@@ -120,7 +145,7 @@ class FietstestMeasurements:
         return self.patient.weight
 
 
-@dataclass
+@dataclass(slots=True)
 class FietstestMetrics:
     """Derived values shown in the bicycle stress test UI."""
 
@@ -136,7 +161,7 @@ class FietstestMetrics:
     summary_lines: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ECGMeasurements:
     """Structured input extracted from ECG PDF or manual entry."""
 
@@ -164,7 +189,7 @@ class ECGMeasurements:
         return self.patient.patient_id
 
 
-@dataclass
+@dataclass(slots=True)
 class ECGMetrics:
     """Derived ECG metrics for display."""
     # QT corrected using Bazett (QTcB) and Fridericia (QTcF) formulas in ms
@@ -176,7 +201,7 @@ class ECGMetrics:
     summary_lines: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HolterMeasurements:
     """Structured input for Holter monitoring interpretation."""
 
@@ -203,7 +228,7 @@ class HolterMeasurements:
         return self.patient.leeftijd
 
 
-@dataclass
+@dataclass(slots=True)
 class HolterMetrics:
     """Derived metrics and summary for Holter monitoring."""
 
@@ -217,7 +242,7 @@ class HolterMetrics:
     summary_lines: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LeadMeasurements:
     """Snapshot of per-lead measurements during a CIED follow-up."""
 
@@ -230,7 +255,7 @@ class LeadMeasurements:
     location: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CIEDReportInput:
     """Structured payload for device follow-up reporting."""
 
@@ -264,7 +289,7 @@ class CIEDReportInput:
     lv_fields: LeadMeasurements = field(default_factory=LeadMeasurements)
 
 
-@dataclass
+@dataclass(slots=True)
 class StudySnapshot:
     """Bundle of measurement contexts that can be stored or shared."""
 
@@ -278,15 +303,15 @@ class StudySnapshot:
     def to_dict(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {}
         if self.patient:
-            payload["patient"] = asdict(self.patient)
+            payload["patient"] = _shallow_asdict(self.patient)
         if self.echo:
-            payload["echo"] = self._asdict_drop(self.echo, {"session_state"})
+            payload["echo"] = _shallow_asdict(self.echo, {"session_state"})
         if self.fietstest:
-            payload["fietstest"] = asdict(self.fietstest)
+            payload["fietstest"] = _shallow_asdict(self.fietstest)
         if self.cied:
-            payload["cied"] = asdict(self.cied)
+            payload["cied"] = _shallow_asdict(self.cied)
         if self.ecg:
-            payload["ecg"] = asdict(self.ecg)
+            payload["ecg"] = _shallow_asdict(self.ecg)
         if self.report_texts:
             payload["report_texts"] = dict(self.report_texts)
         return payload
@@ -296,14 +321,21 @@ class StudySnapshot:
         if not data:
             return cls()
 
-        patient = cls._coerce_patient(data.get("patient"))
+        raw_patient = data.get("patient")
+        patient = cls._coerce_patient(raw_patient)
+
+        def _section_patient(raw: Any) -> Optional[PatientContext]:
+            # Sections usually repeat the top-level patient; reuse it instead of rebuilding.
+            if raw is None or raw == raw_patient:
+                return patient
+            return cls._coerce_patient(raw) or patient
 
         def _build_echo(payload: Any) -> Optional[EchoReportInput]:
             if not isinstance(payload, dict):
                 return None
-            values = dict(payload)
+            values = _known_fields(EchoReportInput, payload)
             values.pop("session_state", None)
-            echo_patient = cls._coerce_patient(values.get("patient")) or patient
+            echo_patient = _section_patient(values.get("patient"))
             if echo_patient is None:
                 return None
             values["patient"] = echo_patient
@@ -312,8 +344,8 @@ class StudySnapshot:
         def _build_fietstest(payload: Any) -> Optional[FietstestMeasurements]:
             if not isinstance(payload, dict):
                 return None
-            values = dict(payload)
-            ft_patient = cls._coerce_patient(values.get("patient")) or patient
+            values = _known_fields(FietstestMeasurements, payload)
+            ft_patient = _section_patient(values.get("patient"))
             if ft_patient is None:
                 return None
             values["patient"] = ft_patient
@@ -322,8 +354,8 @@ class StudySnapshot:
         def _build_cied(payload: Any) -> Optional[CIEDReportInput]:
             if not isinstance(payload, dict):
                 return None
-            values = dict(payload)
-            cied_patient = cls._coerce_patient(values.get("patient")) or patient
+            values = _known_fields(CIEDReportInput, payload)
+            cied_patient = _section_patient(values.get("patient"))
             if cied_patient is None:
                 return None
             values["patient"] = cied_patient
@@ -335,8 +367,8 @@ class StudySnapshot:
         def _build_ecg(payload: Any) -> Optional[ECGMeasurements]:
             if not isinstance(payload, dict):
                 return None
-            values = dict(payload)
-            ecg_patient = cls._coerce_patient(values.get("patient")) or patient
+            values = _known_fields(ECGMeasurements, payload)
+            ecg_patient = _section_patient(values.get("patient"))
             if ecg_patient is None:
                 return None
             values["patient"] = ecg_patient
@@ -351,21 +383,14 @@ class StudySnapshot:
             report_texts=dict(data.get("report_texts", {}) or {}),
         )
 
-    @staticmethod
-    def _asdict_drop(obj: Any, drop_keys: Iterable[str]) -> Dict[str, Any]:
-        data = asdict(obj)
-        for key in drop_keys:
-            data.pop(key, None)
-        return data
-
     @staticmethod
     def _coerce_patient(data: Any) -> Optional[PatientContext]:
         if isinstance(data, PatientContext):
             return data
         if isinstance(data, dict):
             try:
-                return PatientContext(**data)
-            except TypeError:
+                return PatientContext(**_known_fields(PatientContext, data))
+            except TypeError:  # "sex" missing
                 return None
         return None
 
@@ -374,8 +399,5 @@ class StudySnapshot:
         if isinstance(data, LeadMeasurements):
             return data
         if isinstance(data, dict):
-            try:
-                return LeadMeasurements(**data)
-            except TypeError:
-                return LeadMeasurements()
+            return LeadMeasurements(**_known_fields(LeadMeasurements, data))
         return LeadMeasurements()
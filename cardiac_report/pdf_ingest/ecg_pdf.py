@@ -2,28 +2,64 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Tuple
 
 from cardiac_report.models import ECGMeasurements, PatientContext
 
 from .patient_extraction import extract_patient_fields
 from .utils import PDFExtractionError, extract_text_from_pdf
 
-
-def _search(pattern: str, text: str) -> Optional[str]:
-    match = re.search(pattern, text, flags=re.IGNORECASE)
+_NUMERIC = re.compile(r"[-+]?\d+(?:\.\d+)?")
+_PATIENT_ID_RE = re.compile(r"pati[eë]nt(?:\s*id)?[:\-]\s*(.+?)\s", re.IGNORECASE)
+_NAME_RE = re.compile(r"naam[:\-]\s*(.+?)\s+(?:geboorte|geslacht)", re.IGNORECASE)
+# Patterns that only capture digits run without IGNORECASE on the lowercased text.
+_DOB_RE = re.compile(r"geboorte(?:datum)?[:\-]\s*(\d{1,2}[-/ ]\d{1,2}[-/ ]\d{2,4})")
+_DATE_RE = re.compile(r"datum[:\-]\s*(\d{1,2}[-/ ]\d{1,2}[-/ ]\d{2,4})")
+_TIMESTAMP_RE = re.compile(r"(\d{2}[./-]\d{2}[./-]\d{4}\s+\d{2}:\d{2}:\d{2})")
+_RHYTHM_RE = re.compile(r"ritme[:\-]\s*(.+?)\s{2,}", re.IGNORECASE)
+_SINUS_RHYTHM_RE = re.compile(r"(sinusritme[^\n]*)", re.IGNORECASE)
+_DEVICE_RE = re.compile(r"toestel[:\-]\s*(.+?)\s{2,}", re.IGNORECASE)
+
+
+def _compile_all(*patterns: str) -> Tuple[Pattern[str], ...]:
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+# Interval and axis patterns per ECGMeasurements field, tried in order on the lowercased text.
+_VENT_RATE_PATTERNS = _compile_all(
+    r"vent(?:riculaire)?\s+frequentie\s*(?:[:=\-]|is)?\s*([^\s]+)",
+    r"hf\s*(?:[:=\-]|is)?\s*([^\s]+)",
+)
+_PR_PATTERNS = _compile_all(r"pr(?:\s*interval)?\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_QRS_PATTERNS = _compile_all(r"qrs(?:\s*duur)?\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_QT_PATTERNS = _compile_all(r"qt(?!c)\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_QTC_PATTERNS = _compile_all(r"qtc[a-z]*\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_P_AXIS_PATTERNS = _compile_all(r"p[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_QRS_AXIS_PATTERNS = _compile_all(r"qrs[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)")
+_P_DURATION_PATTERNS = _compile_all(
+    r"p\s*[-]?\s*duur\s*(?:[:=\-]|is)?\s*([^\s]+)",
+    r"p-?wave(?:\s*duration)?\s*(?:[:=\-]|is)?\s*([^\s]+)",
+    r"p[-\s]?wave[-\s]?duration\s*(?:[:=\-]|is)?\s*([^\s]+)",
+    r"p[-\s]?duur(?:[:=\-]|is)?\s*([^\s]+)",
+)
+_T_AXIS_PATTERNS = _compile_all(r"t[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)")
+
+
+def _search(pattern: Pattern[str], text: str) -> Optional[str]:
+    match = pattern.search(text)
     if match:
         return match.group(1).strip()
     return None
 
 
-def _num(pattern: str, text: str) -> Optional[float]:
+def _num(pattern: Pattern[str], text: str) -> Optional[float]:
     raw = _search(pattern, text)
     if raw is None:
         return None
     try:
         norm = raw.replace(",", ".")
-        match = re.search(r"[-+]?\d+(?:\.\d+)?", norm)
+        match = _NUMERIC.search(norm)
         if not match:
             return None
         return float(match.group())
@@ -31,7 +67,7 @@ def _num(pattern: str, text: str) -> Optional[float]:
         return None
 
 
-def _num_from_patterns(patterns: Iterable[str], text: str) -> Optional[float]:
+def _num_from_patterns(patterns: Iterable[Pattern[str]], text: str) -> Optional[float]:
     for pattern in patterns:
         value = _num(pattern, text)
         if value is not None:
@@ -39,17 +75,20 @@ def _num_from_patterns(patterns: Iterable[str], text: str) -> Optional[float]:
     return None
 
 
+@lru_cache(maxsize=None)
+def _label_patterns(label: str) -> Tuple[Pattern[str], Pattern[str]]:
+    """Return the (same line, next line) patterns for a label; text is whitespace-normalized."""
+    return (
+        re.compile(rf"{label}\s*[:\-]?\s*([^\n]+)", flags=re.IGNORECASE),
+        re.compile(rf"{re.escape(label)}[^\n]*\n\s*([^\n]+)", flags=re.IGNORECASE),
+    )
+
+
 def _line_after_label(text: str, label: str) -> Optional[str]:
-    pattern = re.compile(rf"{label}\s*[:\-]?\s*([^\n]+)", flags=re.IGNORECASE)
-    match = pattern.search(text)
-    if match:
-        candidate = match.group(1).strip()
-        if candidate:
-            return candidate
-    lines = text.splitlines()
-    for idx, line in enumerate(lines):
-        if label.lower() in line.lower() and idx + 1 < len(lines):
-            candidate = lines[idx + 1].strip()
+    for pattern in _label_patterns(label):
+        match = pattern.search(text)
+        if match:
+            candidate = match.group(1).strip()
             if candidate:
                 return candidate
     return None
@@ -64,9 +103,12 @@ def parse_ecg_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Optional[
         return None, None, warnings
 
     patient_fields = extract_patient_fields(text)
-    patient_id = patient_fields.patient_id or _search(r"pati[eë]nt(?:\s*id)?[:\-]\s*(.+?)\s", text)
-    name = patient_fields.full_name or _search(r"naam[:\-]\s*(.+?)\s+(?:geboorte|geslacht)", text)
-    dob = patient_fields.date_of_birth or _search(r"geboorte(?:datum)?[:\-]\s*(\d{1,2}[-/ ]\d{1,2}[-/ ]\d{2,4})", text)
+    # Numeric fields are matched case-sensitively on one lowercased copy; free-text
+    # fields keep their original case and are searched in `text`.
+    text_lc = text.lower()
+    patient_id = patient_fields.patient_id or _search(_PATIENT_ID_RE, text)
+    name = patient_fields.full_name or _search(_NAME_RE, text)
+    dob = patient_fields.date_of_birth or _search(_DOB_RE, text_lc)
 
     patient = PatientContext(
         sex=patient_fields.sex,
@@ -79,15 +121,15 @@ def parse_ecg_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Optional[
         length=patient_fields.length,
     )
 
-    recorded_at = _search(r"datum[:\-]\s*(\d{1,2}[-/ ]\d{1,2}[-/ ]\d{2,4})", text)
+    recorded_at = _search(_DATE_RE, text_lc)
     if recorded_at is None:
-        timestamp_match = re.search(r"(\d{2}[./-]\d{2}[./-]\d{4}\s+\d{2}:\d{2}:\d{2})", text)
+        timestamp_match = _TIMESTAMP_RE.search(text_lc)
         if timestamp_match:
             recorded_at = timestamp_match.group(1)
 
-    rhythm_summary = _search(r"ritme[:\-]\s*(.+?)\s{2,}", text)
+    rhythm_summary = _search(_RHYTHM_RE, text)
     if rhythm_summary is None:
-        rhythm_summary = _search(r"(sinusritme[^\n]*)", text)
+        rhythm_summary = _search(_SINUS_RHYTHM_RE, text)
 
     auto_report_text = (
         _line_after_label(text, "Opmerking")
@@ -95,7 +137,7 @@ def parse_ecg_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Optional[
         or _line_after_label(text, "Protocol")
     )
 
-    acquisition_device = _search(r"toestel[:\-]\s*(.+?)\s{2,}", text)
+    acquisition_device = _search(_DEVICE_RE, text)
     if acquisition_device is None:
         acquisition_device = _line_after_label(text, "Apparaat-ID")
     if acquisition_device:
@@ -104,64 +146,15 @@ def parse_ecg_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Optional[
     measurements = ECGMeasurements(
         patient=patient,
         recorded_at=recorded_at,
-        vent_rate=_num_from_patterns(
-            [
-                r"vent(?:riculaire)?\s+frequentie\s*(?:[:=\-]|is)?\s*([^\s]+)",
-                r"hf\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        pr_interval_ms=_num_from_patterns(
-            [
-                r"pr(?:\s*interval)?\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        qrs_duration_ms=_num_from_patterns(
-            [
-                r"qrs(?:\s*duur)?\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        qt_interval_ms=_num_from_patterns(
-            [
-                r"qt(?!c)\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        qtc_interval_ms=_num_from_patterns(
-            [
-                r"qtc[a-z]*\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        p_axis_deg=_num_from_patterns(
-            [
-                r"p[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        qrs_axis_deg=_num_from_patterns(
-            [
-                r"qrs[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        p_duration_ms=_num_from_patterns(
-            [
-                r"p\s*[-]?\s*duur\s*(?:[:=\-]|is)?\s*([^\s]+)",
-                r"p-?wave(?:\s*duration)?\s*(?:[:=\-]|is)?\s*([^\s]+)",
-                r"p[-\s]?wave[-\s]?duration\s*(?:[:=\-]|is)?\s*([^\s]+)",
-                r"p[-\s]?duur(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
-        t_axis_deg=_num_from_patterns(
-            [
-                r"t[-\s]?(?:axis|as)\s*(?:[:=\-]|is)?\s*([^\s]+)",
-            ],
-            text,
-        ),
+        vent_rate=_num_from_patterns(_VENT_RATE_PATTERNS, text_lc),
+        pr_interval_ms=_num_from_patterns(_PR_PATTERNS, text_lc),
+        qrs_duration_ms=_num_from_patterns(_QRS_PATTERNS, text_lc),
+        qt_interval_ms=_num_from_patterns(_QT_PATTERNS, text_lc),
+        qtc_interval_ms=_num_from_patterns(_QTC_PATTERNS, text_lc),
+        p_axis_deg=_num_from_patterns(_P_AXIS_PATTERNS, text_lc),
+        qrs_axis_deg=_num_from_patterns(_QRS_AXIS_PATTERNS, text_lc),
+        p_duration_ms=_num_from_patterns(_P_DURATION_PATTERNS, text_lc),
+        t_axis_deg=_num_from_patterns(_T_AXIS_PATTERNS, text_lc),
         rhythm_summary=rhythm_summary,
         auto_report_text=auto_report_text,
         acquisition_device=acquisition_device,
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import re
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 
 from cardiac_report.models import FietstestMeasurements, PatientContext
 
@@ -10,38 +10,67 @@ from .utils import PDFExtractionError, extract_text_from_pdf
 from .patient_extraction import extract_patient_fields
 
 _FLAGS = re.IGNORECASE | re.MULTILINE
+# Workload rows and numeric measures are matched case-sensitively on the lowercased text.
+_LC_FLAGS = re.MULTILINE
 _NUMERIC = re.compile(r"[-+]?\d+(?:[\.,]\d+)?")
-_TIME_TOKEN = re.compile(r"(\d{1,2})[:.](\d{2})")
-
-_MEASURE_PATTERNS = {
-    "Start watt": [
+# Durations: the first mm:ss / mm.ss token anywhere wins; otherwise the first number.
+_DURATION_RE = re.compile(r".*?(\d{1,2})[:.](\d{2})|.*?([-+]?\d+(?:[\.,]\d+)?)", re.DOTALL)
+_NON_NUMERIC = re.compile(r"[^0-9\.,]")
+# Workload table rows, e.g. "werken 03:00 (120) W": a line starting with "opwarmen" or
+# "werken" whose watt value is the first token after the first time token; further time
+# tokens are skipped. Tokens are separated by spaces and "-", and may be wrapped in
+# parentheses. The text is normalize_whitespace output, so "\n" is the only line break.
+_WL_SEP = r"(?:[^\S\n]|-)+"
+_WL_TOKEN = r"[^\s-]+"
+_WL_TIME = r"[()]*\d{1,2}[:.]\d{2}[()]*(?![^\s-])"  # a whole mm:ss / mm.ss token
+_WORKLOAD_RE = re.compile(
+    r"^(opwarmen|werken)[^\s-]*"  # row label, e.g. "werken:"
+    rf"(?:{_WL_SEP}(?!{_WL_TIME}){_WL_TOKEN})*"  # tokens before the first time token
+    rf"(?:{_WL_SEP}{_WL_TIME})+"  # the time token(s)
+    rf"{_WL_SEP}(?!{_WL_TIME})({_WL_TOKEN})",  # the watt value
+    _LC_FLAGS,
+)
+_BP_RE = re.compile(r"bloeddruk(?:evolutie)?[:\-]\s*([^\n]+)", _FLAGS)
+_RITME_RE = re.compile(r"ritme[:\-]\s*([^\n]+)", _FLAGS)
+_EFFORT_RE = re.compile(r"inspanning[:\-]\s*([^\n]+)", _FLAGS)
+_CRITERIUM_RE = re.compile(r"criterium[:\-]\s*([^\n]+)", _FLAGS)
+_ECG_RE = re.compile(r"ecg(?:\s+verloop)?[:\-]\s*([^\n]+)", _FLAGS)
+_CONCLUSION_RE = re.compile(r"conclusie[:\-]\s*([^\n]+)", _FLAGS)
+
+
+def _compile_all(*patterns: str) -> Tuple[Pattern[str], ...]:
+    return tuple(re.compile(pattern, _LC_FLAGS) for pattern in patterns)
+
+
+_MEASURE_PATTERNS: Dict[str, Tuple[Pattern[str], ...]] = {
+    "Start watt": _compile_all(
         r"start(?:\s*belasting)?(?:\s*watt)?(?:\s*\(w(?:att)?\))?\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"start\s*load\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
-    ],
-    "Opdrijven": [
+    ),
+    "Opdrijven": _compile_all(
         r"opdrij(?:ving|fing|ven)\s*(?:[(][^)]*\))?\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"stapgrootte\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
-    ],
-    "Max watt": [
+    ),
+    "Max watt": _compile_all(
         r"max(?:imale)?\s*(?:belasting|vermogen|watt)\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"piek\s*watt\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"max[.\s]*belasting[^0-9]*([0-9][0-9\.,]*)\s*w",
-    ],
-    "Duur": [
+    ),
+    "Duur": _compile_all(
         r"duur(?:\s*(?:bij|op))?\s*(?:max(?:imale)?\s*)?(?:belasting|vermogen)?\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"tijd\s*aan\s*top\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"inspanning\s*([0-9]{1,2}[:.][0-9]{2})",
-    ],
-    "Max HR": [
+    ),
+    "Max HR": _compile_all(
         r"max(?:imale)?\s*(?:hartslag|hr|hartfrequentie)\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"piek\s*hr\s*(?:[:=\-]\s*)?([0-9][0-9\.,]*)",
         r"max[.\s]*hf[^0-9]*([0-9][0-9\.,]*)",
-    ],
+    ),
 }
 
 
-def _search(pattern: str, text: str) -> Optional[str]:
-    match = re.search(pattern, text, flags=_FLAGS)
+def _search(pattern: Pattern[str], text: str) -> Optional[str]:
+    match = pattern.search(text)
     if match:
         return match.group(1).strip()
     return None
@@ -50,65 +79,38 @@ def _search(pattern: str, text: str) -> Optional[str]:
 def _to_float(raw: Optional[str]) -> Optional[float]:
     if not raw:
         return None
-    try:
-        norm = raw.replace(",", ".")
-        return float(_NUMERIC.search(norm).group()) if _NUMERIC.search(norm) else None
-    except Exception:
-        return None
+    match = _NUMERIC.search(raw.replace(",", "."))
+    return float(match.group()) if match else None
 
 
 def _to_seconds(raw: Optional[str]) -> Optional[float]:
     if not raw:
         return None
-    match = _TIME_TOKEN.search(raw)
-    if match:
-        minutes = int(match.group(1))
-        seconds = int(match.group(2))
-        return float(minutes * 60 + seconds)
-    return _to_float(raw)
+    match = _DURATION_RE.match(raw)
+    if match is None:
+        return None
+    minutes, seconds, number = match.groups()
+    if number is not None:
+        return float(number.replace(",", "."))
+    return float(int(minutes) * 60 + int(seconds))
 
 
 def _extract_workloads(text: str) -> List[Tuple[str, float]]:
+    """Return unique (label, watt) workload rows; `text` must already be lowercased."""
     series: List[Tuple[str, float]] = []
     seen = set()
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        lower = line.lower()
-        if not (lower.startswith("opwarmen") or lower.startswith("werken")):
-            continue
-        watt = _line_watt_value(line)
-        if watt is None:
+    for match in _WORKLOAD_RE.finditer(text):
+        value = _to_float(_NON_NUMERIC.sub("", match.group(2)))
+        if value is None:
             continue
-        label = "opwarmen" if lower.startswith("opwarmen") else "werken"
-        key = (label, watt)
+        key = (match.group(1), value)
         if key in seen:
             continue
         seen.add(key)
-        series.append((label, watt))
+        series.append(key)
     return series
 
 
-def _line_watt_value(line: str) -> Optional[float]:
-    sanitized = line.replace("-", " ")
-    tokens = sanitized.split()
-    seen_time = False
-    for token in tokens:
-        stripped = token.strip("()")
-        if _TIME_TOKEN.fullmatch(stripped):
-            seen_time = True
-            continue
-        if not seen_time:
-            continue
-        cleaned = re.sub(r"[^0-9\.,]", "", stripped)
-        value = _to_float(cleaned)
-        if value is not None:
-            return value
-        break
-    return None
-
-
 def _first_watt(workloads: List[Tuple[str, float]], prefer: str) -> Optional[float]:
     for label, value in workloads:
         if label == prefer:
@@ -138,6 +140,7 @@ def parse_fietstest_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Opt
         return None, None, warnings
 
     patient_fields = extract_patient_fields(text)
+    text_lc = text.lower()
 
     patient = PatientContext(
         sex=patient_fields.sex,
@@ -152,23 +155,22 @@ def parse_fietstest_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Opt
 
     def _find_measure(
         key: str,
-        patterns: List[str],
-        parser: Callable[[Optional[str]], Optional[float]] = None,
+        patterns: Tuple[Pattern[str], ...],
+        parser: Callable[[Optional[str]], Optional[float]] = _to_float,
         warn: bool = True,
     ) -> Optional[float]:
-        parser = parser or _to_float
         for pattern in patterns:
-            value = _search(pattern, text)
-            if value is None:
+            match = pattern.search(text_lc)
+            if match is None:
                 continue
-            parsed = parser(value)
+            parsed = parser(match.group(1).strip())
             if parsed is not None:
                 return parsed
         if warn:
             warnings.append(f"{key} niet gevonden in PDF")
         return None
 
-    workloads = _extract_workloads(text)
+    workloads = _extract_workloads(text_lc)
 
     start_watt = _find_measure("Start watt", _MEASURE_PATTERNS["Start watt"], warn=False)
     if start_watt is None:
@@ -189,12 +191,12 @@ def parse_fietstest_pdf(pdf_bytes: bytes) -> Tuple[Optional[PatientContext], Opt
     duration_at_max = _find_measure("Duur", _MEASURE_PATTERNS["Duur"], parser=_to_seconds)
     max_hr = _find_measure("Max HR", _MEASURE_PATTERNS["Max HR"])
 
-    bp_evolutie = _search(r"bloeddruk(?:evolutie)?[:\-]\s*([^\n]+)", text)
-    ritme = _search(r"ritme[:\-]\s*([^\n]+)", text)
-    effort_type = _search(r"inspanning[:\-]\s*([^\n]+)", text)
-    stop_criterium = _search(r"criterium[:\-]\s*([^\n]+)", text)
-    ecg_changes = _search(r"ecg(?:\s+verloop)?[:\-]\s*([^\n]+)", text)
-    conclusion = _search(r"conclusie[:\-]\s*([^\n]+)", text)
+    bp_evolutie = _search(_BP_RE, text)
+    ritme = _search(_RITME_RE, text)
+    effort_type = _search(_EFFORT_RE, text)
+    stop_criterium = _search(_CRITERIUM_RE, text)
+    ecg_changes = _search(_ECG_RE, text)
+    conclusion = _search(_CONCLUSION_RE, text)
 
     measurements = FietstestMeasurements(
         patient=patient,
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Pattern
 
 from .utils import normalize_whitespace
 
@@ -20,9 +20,29 @@ _OCR_DIGIT_FIXUPS = str.maketrans({
     "s": "5",
     "B": "8",
     "T": "7",
+    ",": ".",  # decimal comma
 })
 
 
+def _label_pattern(label: str) -> str:
+    return rf"{label}(?:[:=\-]\s*|[.\s]+)([^\n]+)"
+
+
+_NAME_RE = re.compile(_label_pattern("naam"), re.IGNORECASE)
+_PATIENT_ID_RE = re.compile(
+    r"(?:pati[éeë]?nt[-\s]*(?:id|nr)|patient\s*id|mrn)(?:[:=\-]\s*|\s+)([^\n]+)", re.IGNORECASE
+)
+_PATIENT_ID_ALT_RE = re.compile(r"(?:order[-\s]*id|bezoek[-\s]*id)(?:[:=\-]\s*|\s+)([^\n]+)", re.IGNORECASE)
+_DOB_RE = re.compile(
+    r"(?:geboorte(?:datum|dat)|dob|date\s*of\s*birth)(?:[:=\-]\s*|[.\s]+)([^\n]+)", re.IGNORECASE
+)
+_AGE_RE = re.compile(_label_pattern("leeftijd"), re.IGNORECASE)
+_BSA_RE = re.compile(_label_pattern(r"\bBSA\b"), re.IGNORECASE)
+_WEIGHT_RE = re.compile(_label_pattern("(?:gewicht|weight)"), re.IGNORECASE)
+_LENGTH_RE = re.compile(_label_pattern("(?:lengte|length|height)"), re.IGNORECASE)
+_SEX_RE = re.compile(_label_pattern("(?:geslacht|sex|gender)"), re.IGNORECASE)
+
+
 @dataclass
 class PatientFields:
     """Loose container for patient details discovered inside a PDF."""
@@ -42,20 +62,15 @@ def extract_patient_fields(raw_text: str) -> PatientFields:
 
     text = normalize_whitespace(raw_text)
 
-    full_name = _clean_name(_match(_label_pattern("naam"), text))
-    patient_id_primary = _match(
-        r"(?:pati[éeë]?nt[-\s]*(?:id|nr)|patient\s*id|mrn)(?:[:=\-]\s*|\s+)([^\n]+)",
-        text,
-    )
-    patient_id_secondary = _match(r"(?:order[-\s]*id|bezoek[-\s]*id)(?:[:=\-]\s*|\s+)([^\n]+)", text)
-    date_of_birth = _extract_date(
-        _match(r"(?:geboorte(?:datum|dat)|dob|date\s*of\s*birth)(?:[:=\-]\s*|[.\s]+)([^\n]+)", text)
-    )
-    leeftijd = _extract_numeric(_match(_label_pattern("leeftijd"), text))
-    bsa = _extract_numeric(_match(_label_pattern(r"\bBSA\b"), text))
-    weight = _extract_numeric(_match(_label_pattern("(?:gewicht|weight)"), text))
-    length = _normalize_length(_match(_label_pattern("(?:lengte|length|height)"), text))
-    sex = _normalize_sex(_match(_label_pattern("(?:geslacht|sex|gender)"), text))
+    full_name = _clean_name(_match(_NAME_RE, text))
+    patient_id_primary = _match(_PATIENT_ID_RE, text)
+    patient_id_secondary = _match(_PATIENT_ID_ALT_RE, text)
+    date_of_birth = _extract_date(_match(_DOB_RE, text))
+    leeftijd = _extract_numeric(_match(_AGE_RE, text))
+    bsa = _extract_numeric(_match(_BSA_RE, text))
+    weight = _extract_numeric(_match(_WEIGHT_RE, text))
+    length = _normalize_length(_match(_LENGTH_RE, text))
+    sex = _normalize_sex(_match(_SEX_RE, text))
 
     return PatientFields(
         sex=sex or "Man",
@@ -69,8 +84,8 @@ def extract_patient_fields(raw_text: str) -> PatientFields:
     )
 
 
-def _match(pattern: str, text: str) -> Optional[str]:
-    match = re.search(pattern, text, flags=re.IGNORECASE)
+def _match(pattern: Pattern[str], text: str) -> Optional[str]:
+    match = pattern.search(text)
     if match:
         return match.group(1).strip()
     return None
@@ -79,13 +94,11 @@ def _match(pattern: str, text: str) -> Optional[str]:
 def _extract_numeric(raw: Optional[str]) -> Optional[float]:
     if not raw:
         return None
-    cleaned = raw.translate(_OCR_DIGIT_FIXUPS)
-    cleaned = cleaned.replace(",", ".")
-    match = _NUMERIC.search(cleaned)
+    match = _NUMERIC.search(raw.translate(_OCR_DIGIT_FIXUPS))
     if not match:
         return None
     try:
-        return float(match.group().replace(",", "."))
+        return float(match.group())
     except ValueError:
         return None
 
@@ -151,7 +164,3 @@ def _first_token(raw: Optional[str]) -> Optional[str]:
         if token:
             return token
     return None
-
-
-def _label_pattern(label: str) -> str:
-    return rf"{label}(?:[:=\-]\s*|[.\s]+)([^\n]+)"
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import io
 import logging
+import os
 import string
-from typing import BinaryIO, Iterable, List, Sequence, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Deque, Iterable, List, Sequence, Union
 
 try:  # Lazy optional dependency; raise friendly error if missing.
     import pdfplumber  # type: ignore
@@ -43,6 +46,11 @@ _OCR_KEYWORDS: Sequence[str] = (
     "protocol",
     "ritme",
 )
+# Byte sets deleted by bytes.translate to count ASCII letters/digits in C.
+_NON_LETTER_BYTES = bytes(c for c in range(256) if chr(c) not in string.ascii_letters)
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if chr(c) not in string.digits)
+# Concurrent tesseract runs per PDF; also the number of rendered page images held at once.
+_OCR_MAX_WORKERS = 4
 PDF_DEPENDENCY_MESSAGE = "PDF import vereist het pdfplumber pakket. Installeer het met 'pip install pdfplumber'."
 PDF_NO_TEXT_MESSAGE = (
     "PDF bevat geen doorzoekbare tekst (waarschijnlijk enkel afbeeldingen). "
@@ -134,19 +142,33 @@ def _extract_text_via_ocr(pdf_bytes: bytes, dpi: int = 300) -> str:
     if pdfplumber is None:  # pragma: no cover - should already be checked
         raise PDFExtractionError(PDF_DEPENDENCY_MESSAGE)
 
+    # Segments are rendered in order on this thread; each tesseract run is a separate
+    # process, so the OCR calls overlap in a small thread pool. At most `workers` rendered
+    # images are in flight: the oldest result is collected before the next is submitted.
+    # Tesseract's own OpenMP threads are limited by the deployment (OMP_THREAD_LIMIT, see README).
+    workers = min(_OCR_MAX_WORKERS, os.cpu_count() or 1)
     page_texts: List[str] = []
+
+    def _collect_oldest(pending: Deque[Future]) -> None:
+        ocr_text = pending.popleft().result()
+        if ocr_text:
+            page_texts.append(ocr_text)
+
     try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf, ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: Deque[Future] = deque()
             for page in pdf.pages:
                 for segment in _iter_page_segments(page):
+                    if len(pending) >= workers:
+                        _collect_oldest(pending)
                     try:
                         pil_image = segment.to_image(resolution=dpi).original
                         pil_image = _prepare_image_for_ocr(pil_image)
                     except Exception as exc:
                         raise PDFExtractionError("Kon PDF niet naar afbeelding renderen voor OCR") from exc
-                    ocr_text = _best_ocr_text(pil_image)
-                    if ocr_text:
-                        page_texts.append(ocr_text)
+                    pending.append(pool.submit(_best_ocr_text, pil_image))
+            while pending:
+                _collect_oldest(pending)
     except PDFExtractionError:
         raise
     except Exception as exc:  # pragma: no cover - unexpected OCR failure
@@ -175,8 +197,9 @@ def _best_ocr_text(image, angles: Sequence[int] = (0, 90, 180, 270)) -> str:
 
 
 def _ocr_text_score(text: str) -> int:
-    letters = sum(1 for char in text if char in string.ascii_letters)
-    digits = sum(1 for char in text if char in string.digits)
+    ascii_text = text.encode("ascii", "ignore")
+    letters = len(ascii_text.translate(None, _NON_LETTER_BYTES))
+    digits = len(ascii_text.translate(None, _NON_DIGIT_BYTES))
     normalized = text.lower()
     keyword_hits = sum(normalized.count(keyword) for keyword in _OCR_KEYWORDS)
     ascii_ratio = letters / max(len(text), 1)
@@ -0,0 +1,187 @@
+"""Bundle the Beleid plan sources into the assets loaded by `cardiac_report.beleid`.
+
+Each scenario in `SCENARIO_DESCRIPTIONS` has one plan source in `beleid/`
+(repository root), named after the scenario slug. Text shared by several
+plans lives once in `beleid/fragments/<name>.md` and is referenced from a
+plan as `{{name}}`. Run after editing a plan or fragment:
+
+    python tools/build_beleid_plans.py
+
+This writes the packed plans and the search index. Plans are stored
+render-ready (see `normalize_plan`), so the app never dedents or strips
+them. Use `--check` to only verify that the committed assets are up to
+date.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import re
+import sys
+import textwrap
+import unicodedata
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = ROOT / "beleid"
+FRAGMENT_DIR = SOURCE_DIR / "fragments"
+
+sys.path.insert(0, str(ROOT))
+
+from cardiac_report.beleid import (  # noqa: E402
+    INDEX_RESOURCE,
+    PLANS_RESOURCE,
+    SCENARIO_CATEGORIES,
+    SCENARIO_DESCRIPTIONS,
+    expand_fragments,
+    tokenize,
+)
+
+DATA_DIR = ROOT / "cardiac_report" / "data"
+# Only ~8 KiB of word runs recur across plans; beyond 2 KiB the extra dictionary
+# bytes cost more than they save per plan.
+ZDICT_SIZE = 2 * 1024
+
+
+def scenario_slug(name: str) -> str:
+    """Return the ASCII file stem used for a scenario's plan source."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "_", ascii_name.lower()).strip("_")
+
+
+def normalize_plan(text: str) -> str:
+    """Return the render-ready form of a plan source.
+
+    Line endings become `\n`, non-breaking spaces become plain spaces, common
+    indentation is removed and the text ends with exactly one newline.
+    """
+    text = text.replace("\r\n", "\n").replace("\xa0", " ")
+    return textwrap.dedent(text).strip() + "\n"
+
+
+def read_sources() -> Dict[str, str]:
+    plans: Dict[str, str] = {}
+    expected = set()
+    for name in SCENARIO_DESCRIPTIONS:
+        path = SOURCE_DIR / f"{scenario_slug(name)}.md"
+        expected.add(path.name)
+        if not path.is_file():
+            raise SystemExit(f"Ontbrekend planbestand voor '{name}': {path}")
+        with path.open(encoding="utf-8", newline="") as fh:
+            plans[name] = normalize_plan(fh.read())
+    orphans = sorted(p.name for p in SOURCE_DIR.glob("*.md") if p.name not in expected)
+    if orphans:
+        raise SystemExit("Planbestanden zonder scenario: " + ", ".join(orphans))
+    return plans
+
+
+def read_fragments() -> Dict[str, str]:
+    fragments: Dict[str, str] = {}
+    for path in sorted(FRAGMENT_DIR.glob("*.md")):
+        with path.open(encoding="utf-8", newline="") as fh:
+            fragments[path.stem] = fh.read()
+    return fragments
+
+
+def check_categories() -> None:
+    categorised = [name for names in SCENARIO_CATEGORIES.values() for name in names]
+    missing = sorted(set(SCENARIO_DESCRIPTIONS) - set(categorised))
+    unknown = sorted(set(categorised) - set(SCENARIO_DESCRIPTIONS))
+    if missing or unknown or len(categorised) != len(set(categorised)):
+        raise SystemExit(
+            f"SCENARIO_CATEGORIES klopt niet: zonder categorie {missing}, onbekend {unknown}"
+        )
+
+
+def _compress_json(obj: object) -> bytes:
+    payload = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    # mtime=0 keeps the output byte-identical across rebuilds.
+    return gzip.compress(payload, compresslevel=9, mtime=0)
+
+
+def train_zdict(texts: Iterable[str], size: int = ZDICT_SIZE) -> bytes:
+    """Build a zlib preset dictionary from word runs shared by several texts.
+
+    zlib favours matches near the end of the dictionary, so the most valuable
+    runs (occurrences x length) are placed last.
+    """
+    counts: Counter = Counter()
+    for text in texts:
+        words = text.split()
+        counts.update({" ".join(words[i : i + 3]) for i in range(len(words) - 2)})
+    shared = [(count * len(run), run) for run, count in counts.items() if count > 1]
+    chosen: List[bytes] = []
+    used = 0
+    for _score, run in sorted(shared, reverse=True):
+        encoded = run.encode("utf-8") + b" "
+        if used + len(encoded) > size:
+            break
+        chosen.append(encoded)
+        used += len(encoded)
+    return b"".join(reversed(chosen))
+
+
+def pack_plans(plans: Dict[str, str], fragments: Dict[str, str]) -> bytes:
+    """Compress each text separately behind an offset header (see `_load_plans`)."""
+    zdict = train_zdict([*plans.values(), *fragments.values()])
+    header: Dict[str, object] = {"zdict": [0, len(zdict)], "plans": {}, "fragments": {}}
+    body = bytearray(zdict)
+    for kind, texts in (("plans", plans), ("fragments", fragments)):
+        entries: Dict[str, List[int]] = {}
+        for name, text in texts.items():
+            compressor = zlib.compressobj(9, zdict=zdict)
+            encoded = compressor.compress(text.encode("utf-8")) + compressor.flush()
+            entries[name] = [len(body), len(encoded)]
+            body += encoded
+        header[kind] = entries
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return len(header_bytes).to_bytes(4, "big") + header_bytes + bytes(body)
+
+
+def build_index(plans: Dict[str, str], fragments: Dict[str, str]) -> Dict[str, object]:
+    names = list(SCENARIO_DESCRIPTIONS)
+    tokens: Dict[str, List[int]] = {}
+    for pos, name in enumerate(names):
+        plan = expand_fragments(plans[name], fragments.__getitem__)
+        text = "\n".join((name, SCENARIO_DESCRIPTIONS[name], plan))
+        for token in sorted(set(tokenize(text))):
+            tokens.setdefault(token, []).append(pos)
+    return {"scenarios": names, "tokens": tokens}
+
+
+def build_assets(plans: Dict[str, str], fragments: Dict[str, str]) -> Dict[Path, bytes]:
+    for name, plan in plans.items():
+        try:
+            expand_fragments(plan, fragments.__getitem__)
+        except KeyError as exc:
+            raise SystemExit(f"Onbekend fragment {exc} in plan '{name}'")
+    return {
+        DATA_DIR / PLANS_RESOURCE: pack_plans(plans, fragments),
+        DATA_DIR / INDEX_RESOURCE: _compress_json(build_index(plans, fragments)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail when the asset is out of date")
+    args = parser.parse_args()
+
+    check_categories()
+    assets = build_assets(read_sources(), read_fragments())
+    if args.check:
+        stale = [path for path, data in assets.items() if not path.is_file() or path.read_bytes() != data]
+        for path in stale:
+            print(f"{path.relative_to(ROOT)} is verouderd; draai tools/build_beleid_plans.py")
+        return 1 if stale else 0
+    for path, data in assets.items():
+        path.write_bytes(data)
+        print(f"{path.relative_to(ROOT)}: {len(data)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())